@@ -0,0 +1,112 @@
+#!/usr/bin/env node
+/**
+ * 로깅 오버헤드 벤치마크
+ * 스캔 핫 패스(헤더 해시 + 캐시 조회)를 흉내 낸 루프에서 로깅 방식별 소요 시간을 비교합니다.
+ * 런처와 같은 조건을 위해 각 모드는 stdout 을 파이프로 연결한 자식 프로세스에서 실행됩니다.
+ *
+ * 사용법: node bench/logging-overhead.cjs [파일 수=100000]
+ */
+
+const { spawn } = require('child_process');
+const crypto = require('crypto');
+const path = require('path');
+
+const MODES = {
+    none: '로깅 없음 (기준)',
+    console: '기존 console.log (파일당 4줄)',
+    'logger-info': 'local-logger info (기본값, 핫 패스 무음)',
+    'logger-debug': 'local-logger debug (버퍼링 JSON-lines)'
+};
+
+// 스캔 루프 1회분의 가짜 작업 (NAS 헤더 해시와 같은 크기)
+const header = crypto.randomBytes(4096);
+
+function simulateFileWork(index) {
+    return crypto.createHash('md5').update(header).update(String(index)).digest('hex');
+}
+
+function runChild(mode, fileCount) {
+    let logger = null;
+    if (mode.startsWith('logger-')) {
+        const { createLogger, configureLogging, flushLogs } = require(path.join(__dirname, '..', 'local-logger.cjs'));
+        // 속도 제한 없이 순수 출력 비용만 측정
+        configureLogging({ level: mode === 'logger-debug' ? 'debug' : 'info', rateLimitPerSec: Number.MAX_SAFE_INTEGER });
+        logger = { thumbnail: createLogger('thumbnail'), cache: createLogger('cache'), nas: createLogger('nas-hash'), flushLogs };
+    }
+
+    const start = process.hrtime.bigint();
+    for (let i = 0; i < fileCount; i++) {
+        const fileName = `IMG_${i}.jpg`;
+        const key = simulateFileWork(i);
+
+        if (mode === 'console') {
+            console.log(`🌐 NAS 파일 헤더 해시 생성: ${fileName} (${(4096 / 1024).toFixed(1)}KB)`);
+            console.log(`  → 헤더 해시 완료: ${key.substring(0, 8)}... (0ms)`);
+            console.log(`🔴 캐시 MISS: ${fileName} - 새로 생성`);
+            console.log(`💾 캐시 매핑 저장: ${fileName} -> ${key}.jpg (header-based)`);
+        } else if (logger) {
+            logger.nas.debug('Header hash computed', { file: fileName, size: 4096, durationMs: 0 });
+            logger.thumbnail.debug('Image cache miss', { file: fileName });
+            logger.cache.debug('Cache mapping saved', { file: fileName, key, method: 'header-based' });
+            logger.thumbnail.debug('Image thumbnail generated', { file: fileName });
+        }
+    }
+    if (logger) {
+        logger.flushLogs();
+    }
+    const elapsedMs = Number(process.hrtime.bigint() - start) / 1e6;
+
+    // stdout 이 모두 비워진 뒤 결과 보고
+    process.stdout.write('', () => {
+        process.send({ mode, elapsedMs }, () => process.exit(0));
+    });
+}
+
+function runMode(mode, fileCount) {
+    return new Promise((resolve, reject) => {
+        const child = spawn(process.execPath, [__filename, '--child', mode, String(fileCount)], {
+            stdio: ['ignore', 'pipe', 'inherit', 'ipc']
+        });
+        let bytes = 0;
+        let result = null;
+        child.stdout.on('data', chunk => { bytes += chunk.length; });
+        child.on('message', message => { result = message; });
+        child.on('error', reject);
+        child.on('exit', code => {
+            if (code !== 0 || !result) {
+                reject(new Error(`${mode} benchmark exited with code ${code}`));
+                return;
+            }
+            resolve({ ...result, stdoutBytes: bytes });
+        });
+    });
+}
+
+async function main() {
+    const fileCount = parseInt(process.argv[2], 10) || 100000;
+    console.log(`📊 Logging overhead benchmark: ${fileCount} files per mode\n`);
+
+    const results = [];
+    for (const mode of Object.keys(MODES)) {
+        results.push(await runMode(mode, fileCount));
+    }
+
+    const baseline = results.find(result => result.mode === 'none').elapsedMs;
+    for (const result of results) {
+        const overheadMs = result.elapsedMs - baseline;
+        console.log(
+            `${MODES[result.mode].padEnd(40)} ${result.elapsedMs.toFixed(0).padStart(7)}ms` +
+            `  overhead ${overheadMs.toFixed(0).padStart(6)}ms (${(overheadMs * 1000 / fileCount).toFixed(2)}µs/file)` +
+            `  stdout ${(result.stdoutBytes / 1024 / 1024).toFixed(1)}MB`
+        );
+    }
+}
+
+if (process.argv[2] === '--child') {
+    runChild(process.argv[3], parseInt(process.argv[4], 10));
+} else {
+    main().catch(error => {
+        console.error('❌ Benchmark failed:', error.message);
+        process.exit(1);
+    });
+}
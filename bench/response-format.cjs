@@ -0,0 +1,133 @@
+#!/usr/bin/env node
+/**
+ * 검색 응답 포맷 벤치마크
+ * 기존 JSON(객체 배열)과 compact(컬럼형) 응답의 전송 크기 및 클라이언트 파싱 시간을 비교합니다.
+ * 클라이언트 디코딩은 브라우저와 같은 public/static/compact-files.js 를 사용합니다.
+ *
+ * 사용법: node bench/response-format.cjs [파일 수=500] [반복=200]
+ */
+
+const crypto = require('crypto');
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+const zlib = require('zlib');
+const { encodeCompactFiles, WIRE_CONFIG } = require(path.join(__dirname, '..', 'local-wire-format.cjs'));
+
+const MEDIA_METADATA_FIELDS = ['width', 'height', 'duration', 'codec', 'camera', 'capturedAt'];
+const ROOT = 'D:\\NAS\\2359 콘텐츠\\촬영본';
+const DIRS = ['2024\\01 신제품', '2024\\02 브랜드 필름', '2024\\03 SNS 숏폼', '2025\\01 캠페인\\원본', '.'];
+const TYPES = [['image', 'jpg'], ['image', 'heic'], ['video', 'mp4'], ['video', 'mov'], ['audio', 'wav']];
+
+// 실제 스캔 결과와 같은 모양의 가짜 파일 목록
+function createFiles(count) {
+    const files = [];
+    for (let i = 0; i < count; i++) {
+        const dir = DIRS[i % DIRS.length];
+        const [mediaType, extension] = TYPES[i % TYPES.length];
+        const filename = `IMG_${String(i).padStart(5, '0')}_촬영.${extension}`;
+        const hash = crypto.createHash('md5').update(String(i)).digest('hex');
+        const isVisual = mediaType !== 'audio';
+        files.push({
+            filename,
+            path: dir,
+            fullPath: dir === '.' ? `${ROOT}\\${filename}` : `${ROOT}\\${dir}\\${filename}`,
+            size: 1000000 + i * 7919,
+            type: `${mediaType}/${extension}`,
+            extension,
+            modifiedAt: new Date(Date.UTC(2024, 0, 1) + i * 3600000).toISOString(),
+            mediaType,
+            thumbnailUrl: isVisual
+                ? `${mediaType === 'video' ? '/api/serve-video-thumbnail/' : '/api/serve-thumbnail/'}${hash}.jpg`
+                : null,
+            metadata: isVisual ? {
+                width: 3840,
+                height: 2160,
+                duration: mediaType === 'video' ? 12.5 + i % 30 : null,
+                codec: mediaType === 'video' ? 'h264' : null,
+                camera: i % 3 === 0 ? 'Sony ILCE-7M4' : null,
+                capturedAt: new Date(Date.UTC(2024, 0, 1) + i * 3500000).toISOString()
+            } : null
+        });
+    }
+    return files;
+}
+
+function loadBrowserDecoder() {
+    const sandbox = { axios: null };
+    sandbox.window = sandbox;
+    vm.runInNewContext(fs.readFileSync(path.join(__dirname, '..', 'public', 'static', 'compact-files.js'), 'utf8'), sandbox);
+    return sandbox.CompactFiles;
+}
+
+function sizes(body) {
+    const buffer = Buffer.from(body);
+    return {
+        raw: buffer.length,
+        gzip: zlib.gzipSync(buffer, { level: WIRE_CONFIG.gzipLevel }).length,
+        br: zlib.brotliCompressSync(buffer, {
+            params: { [zlib.constants.BROTLI_PARAM_QUALITY]: WIRE_CONFIG.brotliQuality }
+        }).length
+    };
+}
+
+// 파싱 + 렌더링에서 읽는 필드 접근까지 포함한 클라이언트 시간
+function timeClient(body, decode, iterations) {
+    let checksum = 0;
+    const start = process.hrtime.bigint();
+    for (let i = 0; i < iterations; i++) {
+        const files = decode(JSON.parse(body));
+        for (const file of files) {
+            checksum += file.filename.length + file.fullPath.length + (file.thumbnailUrl ? 1 : 0);
+        }
+    }
+    const elapsedMs = Number(process.hrtime.bigint() - start) / 1e6;
+    return { perResponseMs: elapsedMs / iterations, checksum };
+}
+
+function main() {
+    const fileCount = parseInt(process.argv[2], 10) || 500;
+    const iterations = parseInt(process.argv[3], 10) || 200;
+    const CompactFiles = loadBrowserDecoder();
+
+    const files = createFiles(fileCount);
+    const verboseBody = JSON.stringify({ status: 'success', files });
+    const compactBody = JSON.stringify({ status: 'success', format: 'compact', files: encodeCompactFiles(files, MEDIA_METADATA_FIELDS) });
+
+    // 왕복 검증: 디코딩 결과가 원본과 같은지 확인
+    const decoded = CompactFiles.decodeFiles(JSON.parse(compactBody).files);
+    files.forEach((file, index) => {
+        const row = decoded[index];
+        for (const field of ['filename', 'path', 'fullPath', 'size', 'type', 'extension', 'mediaType', 'thumbnailUrl']) {
+            if (row[field] !== file[field]) {
+                throw new Error(`Round-trip mismatch at ${index}.${field}: ${row[field]} !== ${file[field]}`);
+            }
+        }
+        if (new Date(row.modifiedAt).toISOString() !== file.modifiedAt) {
+            throw new Error(`Round-trip mismatch at ${index}.modifiedAt`);
+        }
+    });
+
+    console.log(`📊 Search response format benchmark: ${fileCount} files, ${iterations} parses\n`);
+    const results = {
+        json: { sizes: sizes(verboseBody), client: timeClient(verboseBody, data => data.files, iterations) },
+        compact: { sizes: sizes(compactBody), client: timeClient(compactBody, data => CompactFiles.decodeResponse(data).files, iterations) }
+    };
+
+    for (const [format, result] of Object.entries(results)) {
+        const { raw, gzip, br } = result.sizes;
+        console.log(
+            `${format.padEnd(8)} raw ${(raw / 1024).toFixed(1).padStart(7)}KB` +
+            `  gzip ${(gzip / 1024).toFixed(1).padStart(6)}KB  br ${(br / 1024).toFixed(1).padStart(6)}KB` +
+            `  client ${result.client.perResponseMs.toFixed(3)}ms/response`
+        );
+    }
+
+    const ratio = (a, b) => (a / b).toFixed(1);
+    console.log(
+        `\n   json raw -> compact br: ${ratio(results.json.sizes.raw, results.compact.sizes.br)}x smaller, ` +
+        `client ${ratio(results.json.client.perResponseMs, results.compact.client.perResponseMs)}x`
+    );
+}
+
+main();
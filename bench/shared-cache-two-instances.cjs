@@ -0,0 +1,183 @@
+#!/usr/bin/env node
+/**
+ * 팀 공유 썸네일 캐시 2-인스턴스 검증
+ * PORT/MEDIA_CACHE_DIR 는 다르고 SHARED_CACHE_DIR 는 같은 서버 두 개를 띄워 같은 폴더를 스캔합니다.
+ *   1) 서버 A: 썸네일을 생성하고 공유 캐시에 게시
+ *   2) 서버 B: 모든 썸네일을 공유 캐시에서 가져오고 새로 생성하지 않아야 함
+ *      (shared_cache_requests_total{result="hit"} == 이미지 수, thumbnail_generation_seconds 샘플 0)
+ *
+ * 사용법: node bench/shared-cache-two-instances.cjs [이미지 수=8] [기본 포트=3101]
+ */
+
+const { spawn } = require('child_process');
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+const sharp = require('sharp');
+
+const SERVER_SCRIPT = path.join(__dirname, '..', 'local-server.cjs');
+const METRICS_PREFIX = 'media_explorer_';
+const STARTUP_TIMEOUT_MS = 30000;
+const PUBLISH_TIMEOUT_MS = 30000;
+
+// 크기와 색이 서로 다른 JPEG (헤더 해시가 겹치지 않도록)
+async function createFixture(dir, imageCount) {
+    for (let i = 0; i < imageCount; i++) {
+        await sharp({
+            create: {
+                width: 320 + i * 16,
+                height: 240 + i * 8,
+                channels: 3,
+                background: { r: (i * 37) % 256, g: (i * 91) % 256, b: (i * 53) % 256 }
+            }
+        }).jpeg({ quality: 90 }).toFile(path.join(dir, `fixture_${i}.jpg`));
+    }
+}
+
+// Prometheus 텍스트 -> { 이름: [{ labels, value }] }
+function parseMetrics(text) {
+    const samples = {};
+    for (const line of text.split('\n')) {
+        const match = /^([a-zA-Z_:][\w:]*)(?:\{(.*)\})?\s+(\S+)$/.exec(line.trim());
+        if (!match) {
+            continue;
+        }
+        const labels = {};
+        for (const pair of (match[2] || '').matchAll(/(\w+)="((?:[^"\\]|\\.)*)"/g)) {
+            labels[pair[1]] = pair[2];
+        }
+        (samples[match[1]] = samples[match[1]] || []).push({ labels, value: parseFloat(match[3]) });
+    }
+    return samples;
+}
+
+function sumSamples(samples, name, match = {}) {
+    return (samples[METRICS_PREFIX + name] || [])
+        .filter(sample => Object.entries(match).every(([key, value]) => sample.labels[key] === value))
+        .reduce((sum, sample) => sum + sample.value, 0);
+}
+
+async function fetchMetrics(port) {
+    const response = await fetch(`http://127.0.0.1:${port}/metrics`);
+    return parseMetrics(await response.text());
+}
+
+async function waitFor(check, timeoutMs, description) {
+    const deadline = Date.now() + timeoutMs;
+    while (Date.now() < deadline) {
+        try {
+            if (await check()) {
+                return;
+            }
+        } catch {
+            // 서버가 아직 준비되지 않음
+        }
+        await new Promise(resolve => setTimeout(resolve, 250));
+    }
+    throw new Error(`Timed out waiting for ${description}`);
+}
+
+function startServer(name, port, cacheDir, sharedDir) {
+    const child = spawn(process.execPath, [SERVER_SCRIPT], {
+        cwd: path.dirname(SERVER_SCRIPT),
+        env: {
+            ...process.env,
+            PORT: String(port),
+            MEDIA_CACHE_DIR: cacheDir,
+            SHARED_CACHE_DIR: sharedDir,
+            LOG_LEVEL: 'warn'
+        },
+        stdio: ['ignore', 'pipe', 'pipe']
+    });
+
+    // 실패 시 원인 확인용 출력 보관
+    const output = [];
+    const keep = chunk => {
+        output.push(chunk.toString());
+        if (output.length > 200) {
+            output.shift();
+        }
+    };
+    child.stdout.on('data', keep);
+    child.stderr.on('data', keep);
+
+    return { name, port, child, output };
+}
+
+async function scan(server, folderPath) {
+    const response = await fetch(`http://127.0.0.1:${server.port}/api/scan`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ path: folderPath, sessionId: `shared-cache-check-${server.name}`, includeSubfolders: false })
+    });
+    const result = await response.json();
+    if (result.status !== 'success') {
+        throw new Error(`${server.name} scan failed: ${result.message || response.status}`);
+    }
+    return result;
+}
+
+async function main() {
+    const imageCount = parseInt(process.argv[2], 10) || 8;
+    const basePort = parseInt(process.argv[3], 10) || 3101;
+
+    const workDir = fs.mkdtempSync(path.join(os.tmpdir(), 'media-explorer-shared-'));
+    const fixtureDir = path.join(workDir, 'fixture');
+    const sharedDir = path.join(workDir, 'shared');
+    fs.mkdirSync(fixtureDir);
+
+    const servers = [];
+    try {
+        await createFixture(fixtureDir, imageCount);
+        console.log(`📁 Fixture: ${imageCount} images in ${fixtureDir}`);
+
+        servers.push(startServer('A', basePort, path.join(workDir, 'cache-a'), sharedDir));
+        servers.push(startServer('B', basePort + 1, path.join(workDir, 'cache-b'), sharedDir));
+        const [serverA, serverB] = servers;
+        for (const server of servers) {
+            await waitFor(() => fetchMetrics(server.port).then(() => true), STARTUP_TIMEOUT_MS, `server ${server.name} startup`);
+        }
+
+        // 1) A: 생성 + 게시 (게시는 스캔 응답 후 백그라운드로 끝나므로 메트릭으로 대기)
+        await scan(serverA, fixtureDir);
+        await waitFor(async () => {
+            const metrics = await fetchMetrics(serverA.port);
+            return sumSamples(metrics, 'shared_cache_publishes_total', { kind: 'image', result: 'published' }) >= imageCount;
+        }, PUBLISH_TIMEOUT_MS, 'server A to publish thumbnails');
+        const metricsA = await fetchMetrics(serverA.port);
+        console.log(`🅰️  A generated ${sumSamples(metricsA, 'thumbnail_generation_seconds_count')} thumbnails, ` +
+            `published ${sumSamples(metricsA, 'shared_cache_publishes_total', { result: 'published' })}`);
+
+        // 2) B: 공유 캐시에서만 가져와야 함
+        await scan(serverB, fixtureDir);
+        const metricsB = await fetchMetrics(serverB.port);
+        const hits = sumSamples(metricsB, 'shared_cache_requests_total', { kind: 'image', result: 'hit' });
+        const generated = sumSamples(metricsB, 'thumbnail_generation_seconds_count');
+        console.log(`🅱️  B shared cache hits ${hits}/${imageCount}, generated ${generated} thumbnails`);
+
+        if (hits !== imageCount || generated !== 0) {
+            throw new Error(`expected ${imageCount} shared hits and 0 generated thumbnails on B`);
+        }
+        console.log('✅ Shared thumbnail cache works across instances');
+    } catch (error) {
+        console.error(`❌ ${error.message}`);
+        for (const server of servers) {
+            console.error(`\n--- server ${server.name} output ---\n${server.output.join('').slice(-4000)}`);
+        }
+        process.exitCode = 1;
+    } finally {
+        for (const server of servers) {
+            server.child.kill();
+        }
+        await Promise.all(servers.map(server => new Promise(resolve => {
+            if (server.child.exitCode !== null) {
+                resolve();
+            } else {
+                server.child.once('exit', resolve);
+            }
+        })));
+        fs.rmSync(workDir, { recursive: true, force: true });
+    }
+}
+
+main();
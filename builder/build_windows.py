@@ -11,11 +11,26 @@ import subprocess
 import zipfile
 import urllib.request
 import json
+import argparse
 from pathlib import Path
 import tempfile
 
+# 런처 빌드 방식
+#   onedir  : 압축 해제/UPX 해제 없이 바로 실행 (기본값, 빠른 시작)
+#   onefile : 단일 EXE (실행할 때마다 _MEIPASS 임시 폴더에 압축 해제)
+LAUNCHER_BUILD_MODES = ("onedir", "onefile")
+
+# 런처에서 사용하지 않는 무거운 패키지 (빌드 환경에 설치돼 있어도 포함하지 않음)
+LAUNCHER_EXCLUDES = [
+    'requests', 'urllib3', 'idna', 'charset_normalizer', 'chardet', 'certifi',
+    'PIL', 'numpy', 'unittest'
+]
+
 class WindowsBuilder:
-    def __init__(self):
+    def __init__(self, launcher_mode="onedir"):
+        if launcher_mode not in LAUNCHER_BUILD_MODES:
+            raise ValueError(f"지원하지 않는 런처 빌드 방식: {launcher_mode}")
+        self.launcher_mode = launcher_mode
         self.script_dir = Path(__file__).parent
         self.project_dir = self.script_dir.parent
         self.build_dir = self.script_dir / "build"
@@ -104,6 +119,8 @@ class WindowsBuilder:
             "package.json",
             "package-lock.json",
             "local-server.cjs",
+            "local-logger.cjs",
+            "local-wire-format.cjs",
             "server.cjs",
             "ecosystem.config.cjs",
             "vite.config.ts",
@@ -133,7 +150,7 @@ class WindowsBuilder:
         
     def build_launcher(self):
         """PyInstaller로 런처 빌드"""
-        print("\n🔨 런처 빌드 중...")
+        print(f"\n🔨 런처 빌드 중... ({self.launcher_mode})")
         
         # PyInstaller 설정 파일 생성
         spec_content = f"""
@@ -144,16 +161,87 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[],
-    hiddenimports=['tkinter', 'requests'],
+    hiddenimports=['tkinter'],
     hookspath=[],
     hooksconfig={{}},
     runtime_hooks=[],
-    excludes=[],
+    excludes={LAUNCHER_EXCLUDES!r},
     noarchive=False,
 )
 
 pyz = PYZ(a.pure)
+"""
+        if self.launcher_mode == "onedir":
+            spec_content += self._onedir_spec()
+        else:
+            spec_content += self._onefile_spec()
+        
+        spec_file = self.build_dir / "launcher.spec"
+        spec_file.write_text(spec_content)
+        
+        # onedir 결과물은 별도 폴더에 만든 뒤 output 으로 옮김 (node/, ffmpeg/, app/ 과 같은 위치)
+        dist_path = self.build_dir / "launcher-dist" if self.launcher_mode == "onedir" else self.output_dir
+        
+        # PyInstaller 실행
+        try:
+            subprocess.run([
+                sys.executable, "-m", "PyInstaller",
+                "--distpath", str(dist_path),
+                "--workpath", str(self.build_dir),
+                "--noconfirm",
+                str(spec_file)
+            ], check=True)
+            
+            if self.launcher_mode == "onedir":
+                collected_dir = dist_path / "MediaExplorer"
+                for item in collected_dir.iterdir():
+                    target = self.output_dir / item.name
+                    if target.exists():
+                        shutil.rmtree(target) if target.is_dir() else target.unlink()
+                    shutil.move(str(item), str(target))
+            
+            print("✅ 런처 빌드 완료")
+            
+        except subprocess.CalledProcessError as e:
+            print(f"❌ 런처 빌드 실패: {e}")
+            raise
+            
+    def _onedir_spec(self):
+        """onedir 빌드 설정 (압축 해제 없음, UPX 미사용)"""
+        return """
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name='MediaExplorer',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=False,
+    console=False,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+    icon=None,
+    version_file=None,
+)
 
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=False,
+    name='MediaExplorer',
+)
+"""
+        
+    def _onefile_spec(self):
+        """onefile 빌드 설정 (기존 단일 EXE 방식)"""
+        return """
 exe = EXE(
     pyz,
     a.scripts,
@@ -177,25 +265,6 @@ exe = EXE(
     version_file=None,
 )
 """
-        
-        spec_file = self.build_dir / "launcher.spec"
-        spec_file.write_text(spec_content)
-        
-        # PyInstaller 실행
-        try:
-            subprocess.run([
-                sys.executable, "-m", "PyInstaller",
-                "--distpath", str(self.output_dir),
-                "--workpath", str(self.build_dir),
-                "--noconfirm",
-                str(spec_file)
-            ], check=True)
-            
-            print("✅ 런처 빌드 완료")
-            
-        except subprocess.CalledProcessError as e:
-            print(f"❌ 런처 빌드 실패: {e}")
-            raise
             
     def create_installer_script(self):
         """NSIS 설치 스크립트 생성"""
@@ -445,6 +514,15 @@ pause
             sys.exit(1)
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Windows용 Media Explorer 설치 패키지 빌드")
+    parser.add_argument(
+        "--launcher-mode",
+        choices=LAUNCHER_BUILD_MODES,
+        default="onedir",
+        help="런처 EXE 빌드 방식 (기본: onedir - 빠른 시작)"
+    )
+    args = parser.parse_args()
+    
     # 필요한 패키지 설치 확인
     try:
         import PyInstaller
@@ -452,5 +530,5 @@ if __name__ == "__main__":
         print("PyInstaller를 설치합니다...")
         subprocess.run([sys.executable, "-m", "pip", "install", "pyinstaller"], check=True)
         
-    builder = WindowsBuilder()
+    builder = WindowsBuilder(launcher_mode=args.launcher_mode)
     builder.build()
\ No newline at end of file
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Media Explorer 런처 시작 시간 측정 하네스
+더블클릭(프로세스 생성)부터 런처 창이 화면에 표시될 때까지의 시간을 측정합니다.
+
+- 첫 실행을 cold, 나머지를 warm 으로 집계합니다.
+  (정확한 cold 값은 재부팅 직후 또는 빌드 직후 첫 측정을 권장)
+- --history 파일에 결과를 누적해 릴리스 간 변화를 비교합니다.
+- --budget-ms 를 지정하면 warm 중앙값이 예산을 넘을 때 실패(exit 1)합니다.
+
+사용 예:
+    python measure_startup.py --exe output/MediaExplorer.exe --runs 7 --history startup-history.json --label v1.1.0
+    python measure_startup.py                # 빌드 없이 개발 환경 런처(.py) 측정
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import statistics
+import subprocess
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+DEFAULT_EXE = SCRIPT_DIR / "output" / "MediaExplorer.exe"
+LAUNCHER_SCRIPT = SCRIPT_DIR / "media_explorer_launcher.py"
+
+
+def launcher_command(exe_path):
+    """측정할 실행 명령 (EXE 가 없으면 개발용 .py 런처)"""
+    if exe_path:
+        return [str(exe_path)]
+    if DEFAULT_EXE.exists():
+        return [str(DEFAULT_EXE)]
+    return [sys.executable, str(LAUNCHER_SCRIPT)]
+
+
+def measure_once(command, timeout):
+    """런처를 한 번 실행하고 창 표시까지 걸린 시간(ms) 반환"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        probe_file = Path(temp_dir) / "startup.json"
+        env = os.environ.copy()
+        env["MEDIA_EXPLORER_STARTUP_PROBE"] = str(probe_file)
+        env["MEDIA_EXPLORER_STARTUP_EXIT"] = "1"
+
+        started_at = time.time()
+        process = subprocess.Popen(command, env=env, cwd=str(Path(command[-1]).parent))
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            raise RuntimeError(f"런처가 {timeout}초 안에 종료되지 않았습니다.")
+
+        if not probe_file.exists():
+            raise RuntimeError(f"창 표시 기록이 없습니다 (종료 코드 {process.returncode}).")
+
+        probe = json.loads(probe_file.read_text(encoding="utf-8"))
+        return (probe["visible_at"] - started_at) * 1000
+
+
+def summarize(samples):
+    """cold(첫 실행) / warm(나머지) 통계"""
+    warm = samples[1:] or samples
+    return {
+        "cold_ms": round(samples[0], 1),
+        "warm_median_ms": round(statistics.median(warm), 1),
+        "warm_min_ms": round(min(warm), 1),
+        "warm_max_ms": round(max(warm), 1),
+        "runs": len(samples),
+    }
+
+
+def append_history(history_file, label, command, summary):
+    """결과를 이력 파일에 추가하고 직전 결과 반환"""
+    history = []
+    if history_file.exists():
+        history = json.loads(history_file.read_text(encoding="utf-8"))
+    previous = history[-1] if history else None
+
+    history.append({
+        "label": label,
+        "measured_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "command": " ".join(command),
+        **summary,
+    })
+    history_file.write_text(json.dumps(history, indent=2, ensure_ascii=False), encoding="utf-8")
+    return previous
+
+
+def main():
+    parser = argparse.ArgumentParser(description="런처 시작 시간(더블클릭 → 창 표시) 측정")
+    parser.add_argument("--exe", type=Path, help="측정할 런처 EXE (기본: output/MediaExplorer.exe, 없으면 .py)")
+    parser.add_argument("--runs", type=int, default=5, help="실행 횟수 (첫 실행은 cold)")
+    parser.add_argument("--timeout", type=float, default=60, help="실행당 제한 시간(초)")
+    parser.add_argument("--history", type=Path, help="결과를 누적할 JSON 파일")
+    parser.add_argument("--label", default="", help="이력에 남길 버전/빌드 이름")
+    parser.add_argument("--budget-ms", type=float, help="warm 중앙값 허용 한도(ms)")
+    args = parser.parse_args()
+
+    command = launcher_command(args.exe)
+    print(f"⏱️ 런처 시작 시간 측정: {' '.join(command)} ({args.runs}회)")
+
+    samples = []
+    for run in range(args.runs):
+        elapsed = measure_once(command, args.timeout)
+        samples.append(elapsed)
+        print(f"  {'cold' if run == 0 else 'warm'} #{run + 1}: {elapsed:.0f}ms")
+
+    summary = summarize(samples)
+    print(f"\n📊 cold {summary['cold_ms']:.0f}ms | warm 중앙값 {summary['warm_median_ms']:.0f}ms "
+          f"(최소 {summary['warm_min_ms']:.0f}ms, 최대 {summary['warm_max_ms']:.0f}ms)")
+
+    if args.history:
+        previous = append_history(args.history, args.label, command, summary)
+        if previous:
+            delta = summary["warm_median_ms"] - previous["warm_median_ms"]
+            print(f"   직전 결과({previous.get('label') or previous['measured_at']}) 대비 warm {delta:+.0f}ms")
+
+    if args.budget_ms is not None and summary["warm_median_ms"] > args.budget_ms:
+        print(f"❌ warm 중앙값이 예산 {args.budget_ms:.0f}ms 를 초과했습니다.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,19 +4,106 @@ Media Explorer Launcher for Windows
 이 프로그램은 Media Explorer를 실행하는 런처입니다.
 """
 
+# 창이 뜨기 전에 필요한 모듈만 즉시 로드합니다.
+# (webbrowser, urllib 등은 서버 시작 시점에 지연 로드)
 import os
 import sys
 import subprocess
-import webbrowser
 import time
 import json
+import re
 import socket
-import shutil
+from collections import deque
 from pathlib import Path
 import tkinter as tk
 from tkinter import messagebox, ttk
 import threading
-import requests
+
+# 서버 /metrics 스크레이프 주기 (초)
+METRICS_POLL_INTERVAL = 2.0
+METRICS_PREFIX = "media_explorer_"
+# 런처 자신의 스크레이프 요청 (요청 처리량/지연 계산에서 제외)
+METRICS_SCRAPE_LABELS = {"route": "/metrics"}
+
+# 시작 시간 측정 하네스(measure_startup.py)가 지정하는 결과 파일
+STARTUP_PROBE_FILE = os.environ.get("MEDIA_EXPLORER_STARTUP_PROBE")
+
+_http_opener = None
+
+
+def http_get(url, timeout=1):
+    """로컬 서버 GET 요청 (표준 라이브러리만 사용, 프록시 설정 무시)"""
+    global _http_opener
+    if _http_opener is None:
+        import urllib.request
+        _http_opener = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+    with _http_opener.open(url, timeout=timeout) as response:
+        return response.status, response.read().decode("utf-8", errors="replace")
+
+
+_METRIC_LINE_RE = re.compile(r'^([a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{(.*)\})?\s+(\S+)$')
+_METRIC_LABEL_RE = re.compile(r'(\w+)="((?:[^"\\]|\\.)*)"')
+
+
+def parse_prometheus_metrics(text):
+    """Prometheus 텍스트 포맷을 {메트릭명: [(라벨, 값), ...]} 으로 변환"""
+    samples = {}
+    for line in text.splitlines():
+        if not line or line.startswith("#"):
+            continue
+        match = _METRIC_LINE_RE.match(line)
+        if not match:
+            continue
+        name, label_text, value = match.groups()
+        labels = dict(_METRIC_LABEL_RE.findall(label_text or ""))
+        try:
+            samples.setdefault(name, []).append((labels, float(value)))
+        except ValueError:
+            continue
+    return samples
+
+
+def _is_excluded(labels, exclude):
+    """exclude 의 라벨이 모두 일치하는 샘플인지"""
+    return bool(exclude) and all(labels.get(key) == value for key, value in exclude.items())
+
+
+def sum_samples(samples, name, exclude=None, **match):
+    """라벨 조건에 맞는 샘플 값 합계 (exclude 라벨과 일치하는 샘플 제외)"""
+    return sum(
+        value for labels, value in samples.get(METRICS_PREFIX + name, [])
+        if all(labels.get(key) == expected for key, expected in match.items())
+        and not _is_excluded(labels, exclude)
+    )
+
+
+def histogram_buckets(samples, name, exclude=None):
+    """모든 라벨을 합친 누적 버킷 [(상한, 누적 개수), ...] (exclude 라벨과 일치하는 시계열 제외)"""
+    totals = {}
+    for labels, value in samples.get(METRICS_PREFIX + name + "_bucket", []):
+        if _is_excluded(labels, exclude):
+            continue
+        bound = float("inf") if labels.get("le") == "+Inf" else float(labels.get("le", "inf"))
+        totals[bound] = totals.get(bound, 0) + value
+    return sorted(totals.items())
+
+
+def histogram_quantile(quantile, buckets):
+    """누적 버킷에서 분위수 추정 (버킷 내부는 선형 보간)"""
+    if not buckets or buckets[-1][1] <= 0:
+        return None
+    rank = quantile * buckets[-1][1]
+    previous_bound, previous_count = 0.0, 0.0
+    for bound, count in buckets:
+        if count >= rank:
+            if bound == float("inf"):
+                return previous_bound
+            if count == previous_count:
+                return bound
+            return previous_bound + (bound - previous_bound) * (rank - previous_count) / (count - previous_count)
+        previous_bound, previous_count = bound, count
+    return previous_bound
+
 
 class MediaExplorerLauncher:
     def __init__(self):
@@ -40,6 +127,10 @@ class MediaExplorerLauncher:
         self.app_path = self.install_path / "app"
         
         self.server_process = None
+        self.server_port = None
+        self.metrics_running = False
+        self.previous_metrics = None
+        self.server_log_tail = deque(maxlen=200)
         self.setup_ui()
         
     def setup_ui(self):
@@ -80,14 +171,14 @@ class MediaExplorerLauncher:
         self.progress.pack(pady=10)
         
         # 로그 텍스트
-        log_frame = tk.Frame(status_frame, bg="white")
-        log_frame.pack(fill="both", expand=True, pady=10)
+        self.log_frame = tk.Frame(status_frame, bg="white")
+        self.log_frame.pack(fill="both", expand=True, pady=10)
         
-        scrollbar = tk.Scrollbar(log_frame)
+        scrollbar = tk.Scrollbar(self.log_frame)
         scrollbar.pack(side="right", fill="y")
         
         self.log_text = tk.Text(
-            log_frame,
+            self.log_frame,
             height=10,
             width=50,
             yscrollcommand=scrollbar.set,
@@ -97,9 +188,36 @@ class MediaExplorerLauncher:
         self.log_text.pack(side="left", fill="both", expand=True)
         scrollbar.config(command=self.log_text.yview)
         
+        # 실시간 성능 패널 (서버 실행 중에는 로그 대신 표시)
+        self.metrics_frame = tk.Frame(status_frame, bg="#F5F5F5", padx=10, pady=10)
+        self.metrics_labels = {}
+        metric_rows = [
+            ("throughput", "처리량"),
+            ("thumbnail_p95", "썸네일 p95"),
+            ("request_p95", "요청 p95"),
+            ("hit_rate", "캐시 적중률"),
+            ("queue_depth", "대기열"),
+            ("event_loop", "이벤트 루프 지연"),
+        ]
+        for row, (key, title) in enumerate(metric_rows):
+            tk.Label(
+                self.metrics_frame, text=title, font=("Arial", 10), bg="#F5F5F5", anchor="w"
+            ).grid(row=row, column=0, sticky="w", pady=2)
+            self.metrics_labels[key] = tk.Label(
+                self.metrics_frame, text="-", font=("Consolas", 10, "bold"), bg="#F5F5F5", anchor="e"
+            )
+            self.metrics_labels[key].grid(row=row, column=1, sticky="e", padx=(20, 0), pady=2)
+        self.metrics_frame.grid_columnconfigure(1, weight=1)
+        self.last_log_label = tk.Label(
+            self.metrics_frame, text="", font=("Consolas", 8), bg="#F5F5F5", fg="#7F8C8D",
+            anchor="w", width=60
+        )
+        self.last_log_label.grid(row=len(metric_rows), column=0, columnspan=2, sticky="w", pady=(8, 0))
+        
         # 버튼 프레임
         button_frame = tk.Frame(status_frame, bg="white")
         button_frame.pack(pady=10)
+        self.button_frame = button_frame
         
         self.start_button = tk.Button(
             button_frame,
@@ -236,7 +354,7 @@ class MediaExplorerLauncher:
                 [str(node_exe), str(server_js)],
                 cwd=str(self.app_path),
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                stderr=subprocess.STDOUT,  # 비정상 종료 시 스택 트레이스도 로그에 표시
                 text=True,
                 env=env
             )
@@ -248,8 +366,8 @@ class MediaExplorerLauncher:
             max_retries = 10
             for i in range(max_retries):
                 try:
-                    response = requests.get(f"http://localhost:{port}/api/system-info", timeout=1)
-                    if response.status_code == 200:
+                    status, _ = http_get(f"http://localhost:{port}/api/system-info", timeout=1)
+                    if status == 200:
                         self.log(f"✅ 서버가 성공적으로 시작되었습니다!")
                         break
                 except:
@@ -257,13 +375,18 @@ class MediaExplorerLauncher:
                     
             # 브라우저 열기
             self.log(f"🌐 브라우저를 엽니다...")
+            import webbrowser
             webbrowser.open(f"http://localhost:{port}/real")
             
             self.status_label.config(text=f"✅ 실행 중 (포트: {port})")
+            self.server_port = port
             
             # 서버 로그 모니터링 시작
             threading.Thread(target=self.monitor_server, daemon=True).start()
             
+            # 실시간 성능 패널로 전환
+            self.show_metrics_panel()
+            
         except Exception as e:
             self.log(f"❌ 시작 실패: {str(e)}")
             messagebox.showerror("시작 실패", str(e))
@@ -272,14 +395,151 @@ class MediaExplorerLauncher:
             
     def monitor_server(self):
         """서버 로그 모니터링"""
-        if self.server_process:
-            for line in self.server_process.stdout:
-                if line.strip():
-                    self.log(f"[서버] {line.strip()}")
+        process = self.server_process
+        if process:
+            for line in process.stdout:
+                line = self.format_server_line(line.strip())
+                if not line:
+                    continue
+                self.server_log_tail.append(line)
+                # 성능 패널 표시 중에는 줄마다 Tk 로그에 쓰지 않음
+                if not self.metrics_running:
+                    self.log(f"[서버] {line}")
+            # stdout 이 닫힘 = 서버 프로세스 종료
+            returncode = process.wait()
+            self.root.after(0, self.handle_server_exit, process, returncode)
+            
+    def handle_server_exit(self, process, returncode):
+        """서버가 스스로 종료된 경우 성능 패널을 닫고 종료 직전 로그와 버튼 복원 (Tk 메인 스레드)"""
+        if process is not self.server_process:
+            # stop_app 으로 종료한 경우
+            return
+        if self.metrics_running:
+            self.hide_metrics_panel()
+        self.server_process = None
+        self.server_port = None
+        self.log(f"❌ 서버가 종료되었습니다 (종료 코드: {returncode})")
+        self.status_label.config(text="❌ 서버 중지됨")
+        self.start_button.config(state="normal")
+        self.stop_button.config(state="disabled")
+                    
+    def format_server_line(self, line):
+        """서버 JSON-lines 로그를 한 줄 텍스트로 변환 (일반 텍스트는 그대로)"""
+        if not line.startswith("{"):
+            return line
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            return line
+        level = entry.pop("level", "info")
+        category = entry.pop("category", "")
+        message = entry.pop("msg", "")
+        entry.pop("time", None)
+        details = " ".join(f"{key}={value}" for key, value in entry.items())
+        prefix = "❌ " if level == "error" else "⚠ " if level == "warn" else ""
+        return f"{prefix}[{category}] {message} {details}".strip()
+        
+    def show_metrics_panel(self):
+        """로그 영역을 실시간 성능 패널로 교체하고 스크레이프 시작"""
+        self.log_frame.pack_forget()
+        self.metrics_frame.pack(fill="both", expand=True, pady=10, before=self.button_frame)
+        self.metrics_running = True
+        self.previous_metrics = None
+        threading.Thread(target=self.poll_metrics, daemon=True).start()
+        
+    def hide_metrics_panel(self):
+        """성능 패널을 닫고 로그 영역 복원"""
+        self.metrics_running = False
+        self.metrics_frame.pack_forget()
+        self.log_frame.pack(fill="both", expand=True, pady=10, before=self.button_frame)
+        for line in list(self.server_log_tail)[-20:]:
+            self.log(f"[서버] {line}")
+        self.server_log_tail.clear()
+        
+    def poll_metrics(self):
+        """서버 /metrics 주기적 스크레이프 (백그라운드 스레드)"""
+        while self.metrics_running and self.server_port:
+            try:
+                status, body = http_get(f"http://localhost:{self.server_port}/metrics", timeout=1)
+                if status == 200:
+                    current = (time.monotonic(), parse_prometheus_metrics(body))
+                    summary = self.summarize_metrics(current, self.previous_metrics)
+                    self.previous_metrics = current
+                    self.root.after(0, self.update_metrics_panel, summary)
+            except Exception:
+                self.root.after(0, self.update_metrics_panel, None)
+            time.sleep(METRICS_POLL_INTERVAL)
+            
+    def summarize_metrics(self, current, previous):
+        """스크레이프 결과를 패널 표시값으로 요약 (직전 스크레이프 대비 변화량 사용)"""
+        now, samples = current
+        elapsed = now - previous[0] if previous else None
+        previous_samples = previous[1] if previous else {}
+        
+        def rate(name, exclude=None):
+            if not elapsed:
+                return None
+            delta = sum_samples(samples, name, exclude) - sum_samples(previous_samples, name, exclude)
+            return max(delta, 0) / elapsed
+        
+        def recent_p95(name, exclude=None):
+            # 직전 스크레이프 이후 관측값이 있으면 그 구간의 p95, 없으면 누적 p95
+            buckets = histogram_buckets(samples, name, exclude)
+            previous_buckets = dict(histogram_buckets(previous_samples, name, exclude))
+            window = [(bound, count - previous_buckets.get(bound, 0)) for bound, count in buckets]
+            if window and window[-1][1] > 0:
+                return histogram_quantile(0.95, window)
+            return histogram_quantile(0.95, buckets)
+        
+        hits = sum_samples(samples, "thumbnail_cache_requests_total", result="hit")
+        misses = sum_samples(samples, "thumbnail_cache_requests_total", result="miss")
+        
+        return {
+            "files_per_sec": rate("scanned_files_total"),
+            "requests_per_sec": rate("http_request_duration_seconds_count", METRICS_SCRAPE_LABELS),
+            "thumbnail_p95": recent_p95("thumbnail_generation_seconds"),
+            "request_p95": recent_p95("http_request_duration_seconds", METRICS_SCRAPE_LABELS),
+            "hit_rate": hits / (hits + misses) if hits + misses else None,
+            "metadata_queue": sum_samples(samples, "metadata_queue_depth"),
+            "in_flight": sum_samples(samples, "http_requests_in_flight"),
+            "event_loop_p99": sum_samples(samples, "event_loop_lag_seconds", quantile="0.99"),
+        }
+        
+    def update_metrics_panel(self, summary):
+        """성능 패널 갱신 (Tk 메인 스레드)"""
+        if not self.metrics_running:
+            return
+        if summary is None:
+            self.metrics_labels["throughput"].config(text="서버 응답 없음")
+            return
+        
+        def fmt_ms(seconds):
+            return "-" if seconds is None else f"{seconds * 1000:.0f} ms"
+        
+        files_rate = summary["files_per_sec"]
+        requests_rate = summary["requests_per_sec"]
+        self.metrics_labels["throughput"].config(
+            text="-" if files_rate is None else f"{files_rate:.1f} 파일/s · {requests_rate:.1f} 요청/s"
+        )
+        self.metrics_labels["thumbnail_p95"].config(text=fmt_ms(summary["thumbnail_p95"]))
+        self.metrics_labels["request_p95"].config(text=fmt_ms(summary["request_p95"]))
+        self.metrics_labels["hit_rate"].config(
+            text="-" if summary["hit_rate"] is None else f"{summary['hit_rate'] * 100:.1f}%"
+        )
+        self.metrics_labels["queue_depth"].config(
+            text=f"메타데이터 {summary['metadata_queue']:.0f} · 요청 {summary['in_flight']:.0f}"
+        )
+        self.metrics_labels["event_loop"].config(text=f"p99 {summary['event_loop_p99'] * 1000:.1f} ms")
+        if self.server_log_tail:
+            self.last_log_label.config(text=self.server_log_tail[-1][:80])
                     
     def stop_app(self):
         """앱 종료"""
         try:
+            if self.metrics_running:
+                self.hide_metrics_panel()
+            self.server_port = None
+            
             if self.server_process:
                 self.log("\n⏹ 서버를 종료합니다...")
                 self.server_process.terminate()
@@ -298,15 +558,33 @@ class MediaExplorerLauncher:
             
     def run(self):
         """런처 실행"""
-        # 시스템 체크를 별도 스레드에서 실행
-        threading.Thread(target=self.check_system, daemon=True).start()
+        # 시스템 체크를 별도 스레드에서 실행 (시작 시간 측정 후 바로 종료하는 경우 생략)
+        if os.environ.get("MEDIA_EXPLORER_STARTUP_EXIT") != "1":
+            threading.Thread(target=self.check_system, daemon=True).start()
         
         # 종료 이벤트 처리
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         
+        # 시작 시간 측정 모드: 창이 처음 표시되는 시점 기록
+        if STARTUP_PROBE_FILE:
+            self.root.bind("<Map>", self.report_startup, add="+")
+        
         # GUI 실행
         self.root.mainloop()
         
+    def report_startup(self, event):
+        """창이 화면에 표시된 시각을 측정 하네스에 전달"""
+        if event.widget is not self.root:
+            return
+        self.root.unbind("<Map>")
+        self.root.update_idletasks()
+        Path(STARTUP_PROBE_FILE).write_text(
+            json.dumps({"visible_at": time.time(), "frozen": bool(getattr(sys, "frozen", False))}),
+            encoding="utf-8"
+        )
+        if os.environ.get("MEDIA_EXPLORER_STARTUP_EXIT") == "1":
+            self.root.after(0, self.root.destroy)
+        
     def on_closing(self):
         """창 닫기 이벤트"""
         if self.server_process:
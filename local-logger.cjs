@@ -0,0 +1,254 @@
+/**
+ * Media File Explorer - 로깅 모듈
+ * 레벨 + 카테고리별 샘플링/속도 제한 + 버퍼링된 비동기 JSON-lines 출력
+ *
+ * 환경 변수:
+ *   LOG_LEVEL       error | warn | info | debug | trace (기본: info, 파일 단위 핫 패스는 debug)
+ *   LOG_FORMAT      json | text (기본: json)
+ *   LOG_FILE        지정 시 stdout 대신 파일에 추가 기록
+ *   LOG_SAMPLE      카테고리별 샘플링 비율 (예: "thumbnail=0.01,cache=0.1"), warn 미만 레벨에만 적용
+ *   LOG_RATE_LIMIT  카테고리별 초당 최대 라인 수 (기본: 50), warn 미만 레벨에만 적용
+ */
+
+const fsSync = require('fs');
+
+const LOG_LEVELS = {
+    error: 50,
+    warn: 40,
+    info: 30,
+    debug: 20,
+    trace: 10
+};
+
+const LOG_CONFIG = {
+    level: LOG_LEVELS[process.env.LOG_LEVEL] ? process.env.LOG_LEVEL : 'info',
+    format: process.env.LOG_FORMAT === 'text' ? 'text' : 'json',
+    file: process.env.LOG_FILE || null,
+    sampling: parseSamplingRates(process.env.LOG_SAMPLE),
+    rateLimitPerSec: parseInt(process.env.LOG_RATE_LIMIT, 10) || 50,
+    flushIntervalMs: 200, // 버퍼 플러시 주기
+    maxBufferedLines: 1000 // 이 이상 쌓이면 즉시 플러시
+};
+
+let levelThreshold = LOG_LEVELS[LOG_CONFIG.level];
+let buffer = [];
+let flushTimer = null;
+let fileStream = null;
+
+// 카테고리별 속도 제한 상태 (1초 윈도우)
+const rateWindows = new Map();
+
+// 통계 (벤치마크 및 /metrics 용)
+const loggingStats = {
+    written: 0,
+    sampledOut: 0,
+    rateLimited: 0,
+    flushes: 0
+};
+
+// "thumbnail=0.01,cache=0.1" -> { thumbnail: 0.01, cache: 0.1 }
+function parseSamplingRates(value) {
+    const rates = {};
+    if (!value) {
+        return rates;
+    }
+    for (const pair of value.split(',')) {
+        const [category, rate] = pair.split('=').map(part => part && part.trim());
+        const parsed = parseFloat(rate);
+        if (category && !isNaN(parsed)) {
+            rates[category] = Math.max(0, Math.min(1, parsed));
+        }
+    }
+    return rates;
+}
+
+// 실행 중 설정 변경 (테스트/벤치마크용)
+function configureLogging(options = {}) {
+    if (options.level && LOG_LEVELS[options.level]) {
+        LOG_CONFIG.level = options.level;
+        levelThreshold = LOG_LEVELS[options.level];
+    }
+    if (options.format) {
+        LOG_CONFIG.format = options.format === 'text' ? 'text' : 'json';
+    }
+    if (options.sampling) {
+        LOG_CONFIG.sampling = { ...LOG_CONFIG.sampling, ...options.sampling };
+    }
+    if (options.rateLimitPerSec) {
+        LOG_CONFIG.rateLimitPerSec = options.rateLimitPerSec;
+    }
+    if (options.file !== undefined && options.file !== LOG_CONFIG.file) {
+        flushLogs();
+        if (fileStream) {
+            fileStream.end();
+            fileStream = null;
+        }
+        LOG_CONFIG.file = options.file;
+    }
+}
+
+function isLevelEnabled(level) {
+    return LOG_LEVELS[level] >= levelThreshold;
+}
+
+// 윈도우에서 버려진 라인 수를 한 줄로 보고
+function reportSuppressed(category, window, now) {
+    if (window.reportTimer) {
+        clearTimeout(window.reportTimer);
+        window.reportTimer = null;
+    }
+    if (window.suppressed === 0) {
+        return;
+    }
+    enqueue(formatLine('warn', category, 'log lines suppressed by rate limit', {
+        suppressed: window.suppressed
+    }, now));
+    window.suppressed = 0;
+}
+
+// 속도 제한 확인 (초과분은 윈도우 종료 시 한 줄로 보고, 이후 라인이 없어도 타이머로 보고)
+function allowByRateLimit(category, now) {
+    let window = rateWindows.get(category);
+    if (!window || now - window.start >= 1000) {
+        if (window) {
+            reportSuppressed(category, window, now);
+        }
+        window = { start: now, count: 0, suppressed: 0, reportTimer: null };
+        rateWindows.set(category, window);
+    }
+
+    if (window.count >= LOG_CONFIG.rateLimitPerSec) {
+        if (window.suppressed === 0) {
+            const expiredWindow = window;
+            window.reportTimer = setTimeout(() => {
+                expiredWindow.reportTimer = null;
+                reportSuppressed(category, expiredWindow, Date.now());
+            }, Math.max(0, window.start + 1000 - now));
+            window.reportTimer.unref();
+        }
+        window.suppressed++;
+        loggingStats.rateLimited++;
+        return false;
+    }
+    window.count++;
+    return true;
+}
+
+function formatLine(level, category, message, fields, now) {
+    if (LOG_CONFIG.format === 'text') {
+        const extra = fields
+            ? Object.entries(fields).map(([key, value]) => `${key}=${typeof value === 'object' ? JSON.stringify(value) : value}`).join(' ')
+            : '';
+        return `${new Date(now).toISOString()} ${level.toUpperCase()} [${category}] ${message}${extra ? ' ' + extra : ''}`;
+    }
+    return JSON.stringify({ time: now, level, category, msg: message, ...fields });
+}
+
+function enqueue(line) {
+    buffer.push(line);
+    loggingStats.written++;
+
+    if (buffer.length >= LOG_CONFIG.maxBufferedLines) {
+        flushLogs();
+    } else if (!flushTimer) {
+        flushTimer = setTimeout(flushLogs, LOG_CONFIG.flushIntervalMs);
+        flushTimer.unref();
+    }
+}
+
+// 버퍼를 한 번의 write로 출력
+function flushLogs() {
+    if (flushTimer) {
+        clearTimeout(flushTimer);
+        flushTimer = null;
+    }
+    if (buffer.length === 0) {
+        return;
+    }
+
+    const chunk = buffer.join('\n') + '\n';
+    buffer = [];
+    loggingStats.flushes++;
+
+    if (LOG_CONFIG.file) {
+        if (!fileStream) {
+            fileStream = fsSync.createWriteStream(LOG_CONFIG.file, { flags: 'a' });
+        }
+        fileStream.write(chunk);
+    } else {
+        process.stdout.write(chunk);
+    }
+}
+
+function writeLog(level, category, message, fields) {
+    if (LOG_LEVELS[level] < levelThreshold) {
+        return;
+    }
+
+    const now = Date.now();
+
+    // 샘플링/속도 제한은 warn 미만 레벨에만 적용 (경고와 오류는 항상 기록)
+    if (LOG_LEVELS[level] < LOG_LEVELS.warn) {
+        const rate = LOG_CONFIG.sampling[category];
+        if (rate !== undefined && Math.random() >= rate) {
+            loggingStats.sampledOut++;
+            return;
+        }
+        if (!allowByRateLimit(category, now)) {
+            return;
+        }
+    }
+
+    enqueue(formatLine(level, category, message, fields, now));
+}
+
+// 카테고리 로거 생성: log.info('message', { key: value })
+function createLogger(category) {
+    return {
+        error: (message, fields) => writeLog('error', category, message, fields),
+        warn: (message, fields) => writeLog('warn', category, message, fields),
+        info: (message, fields) => writeLog('info', category, message, fields),
+        debug: (message, fields) => writeLog('debug', category, message, fields),
+        trace: (message, fields) => writeLog('trace', category, message, fields),
+        isEnabled: level => isLevelEnabled(level)
+    };
+}
+
+function getLoggingStats() {
+    return { ...loggingStats, level: LOG_CONFIG.level, buffered: buffer.length };
+}
+
+// 종료 시 보고되지 않은 속도 제한 건수와 남은 버퍼를 동기 기록
+process.on('exit', () => {
+    const now = Date.now();
+    for (const [category, window] of rateWindows) {
+        reportSuppressed(category, window, now);
+    }
+    if (flushTimer) {
+        clearTimeout(flushTimer);
+        flushTimer = null;
+    }
+    if (buffer.length === 0) {
+        return;
+    }
+    const chunk = buffer.join('\n') + '\n';
+    buffer = [];
+    try {
+        if (LOG_CONFIG.file) {
+            fsSync.appendFileSync(LOG_CONFIG.file, chunk);
+        } else {
+            fsSync.writeSync(1, chunk);
+        }
+    } catch {
+        // 종료 중 출력 실패는 무시
+    }
+});
+
+module.exports = {
+    LOG_LEVELS,
+    createLogger,
+    configureLogging,
+    flushLogs,
+    getLoggingStats,
+    isLevelEnabled
+};
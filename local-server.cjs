@@ -11,16 +11,87 @@ const path = require('path');
 const sharp = require('sharp');
 const mime = require('mime-types');
 const crypto = require('crypto');
-const { exec } = require('child_process');
+const os = require('os');
+const { exec, execFile } = require('child_process');
 const util = require('util');
 const execPromise = util.promisify(exec);
+const execFilePromise = util.promisify(execFile);
 const open = require('open');
+const { performance, monitorEventLoopDelay } = require('perf_hooks');
+const { AsyncLocalStorage } = require('async_hooks');
+const { createLogger, getLoggingStats } = require('./local-logger.cjs');
+const { encodeCompactFiles, createETag, isNotModified, sendNotModified, sendJson } = require('./local-wire-format.cjs');
 
 const app = express();
 const PORT = process.env.PORT || 3000;
 
+// 카테고리별 로거 (파일 단위 핫 패스는 debug 레벨 - 기본 info 에서는 출력 안 함)
+const log = {
+    scan: createLogger('scan'),
+    thumbnail: createLogger('thumbnail'),
+    cache: createLogger('cache'),
+    nas: createLogger('nas-hash'),
+    search: createLogger('search'),
+    ffmpeg: createLogger('ffmpeg'),
+    metadata: createLogger('metadata')
+};
+
+// 스캔 단위 집계 (핫 패스 로그 대신 스캔 종료 시 한 줄 요약)
+const scanSummaryStorage = new AsyncLocalStorage();
+
+function countScanEvent(event, durationMs = null) {
+    const summary = scanSummaryStorage.getStore();
+    if (!summary) {
+        return;
+    }
+    summary.counts[event] = (summary.counts[event] || 0) + 1;
+    if (durationMs !== null) {
+        summary.durationsMs[event] = Math.round(((summary.durationsMs[event] || 0) + durationMs) * 100) / 100;
+    }
+}
+
+// 요청 지연 측정 + 선택적 트레이싱 (x-trace: 1 헤더 또는 MEDIA_EXPLORER_TRACE=1)
+app.use((req, res, next) => {
+    const tracing = METRICS_CONFIG.tracingEnabled || req.get('x-trace') === '1';
+    const trace = tracing
+        ? { id: crypto.randomUUID(), method: req.method, url: req.originalUrl, start: performance.now(), spans: [] }
+        : null;
+    const requestStart = performance.now();
+    
+    httpRequestsInFlight++;
+    
+    res.on('close', () => {
+        httpRequestsInFlight--;
+        
+        const route = req.route ? req.route.path : (res.statusCode === 404 ? 'unmatched' : 'static');
+        const durationMs = performance.now() - requestStart;
+        observeHistogram(metrics.httpRequestDuration, {
+            method: req.method,
+            route,
+            status: res.statusCode
+        }, durationMs / 1000);
+        
+        if (trace) {
+            trace.route = route;
+            trace.status = res.statusCode;
+            trace.durationMs = Math.round(durationMs * 100) / 100;
+            delete trace.start;
+            recentTraces.push(trace);
+            if (recentTraces.length > METRICS_CONFIG.traceHistorySize) {
+                recentTraces.shift();
+            }
+        }
+    });
+    
+    if (trace) {
+        res.set('X-Trace-Id', trace.id);
+        return traceStorage.run(trace, next);
+    }
+    next();
+});
+
 // Middleware - UTF-8 인코딩 설정 추가
-app.use(cors());
+app.use(cors({ exposedHeaders: ['ETag'] })); // 검색 응답 ETag 재검증용
 app.use(express.json({ limit: '50mb' }));
 app.use(express.urlencoded({ extended: true, limit: '50mb' }));
 app.use(express.static('public'));
@@ -36,11 +107,16 @@ const sessions = new Map();
 const recentPaths = new Set();
 const MAX_RECENT_PATHS = 10;
 
+// 세션 데이터 버전 (검색 ETag 용, 서버 재시작 후에도 겹치지 않도록 부팅 ID 포함)
+const SESSION_BOOT_ID = crypto.randomBytes(4).toString('hex');
+let sessionVersionCounter = 0;
+
 // Cache directory
-const CACHE_DIR = path.join(__dirname, 'media-cache');
+const CACHE_DIR = process.env.MEDIA_CACHE_DIR || path.join(__dirname, 'media-cache');
 const THUMBNAILS_DIR = path.join(CACHE_DIR, 'thumbnails');
 const VIDEO_THUMBNAILS_DIR = path.join(CACHE_DIR, 'video-thumbnails');
 const CACHE_METADATA_FILE = path.join(CACHE_DIR, 'cache-metadata.json');
+const MEDIA_METADATA_FILE = path.join(CACHE_DIR, 'media-metadata.json');
 
 // 캐시 설정
 const CACHE_CONFIG = {
@@ -51,6 +127,219 @@ const CACHE_CONFIG = {
     compressionQuality: 80 // WebP 압축 품질
 };
 
+// 팀 공유 썸네일 캐시 설정 (비어 있으면 사용 안 함, 예: \\nas\share\media-cache)
+const SHARED_CACHE_CONFIG = {
+    dir: process.env.SHARED_CACHE_DIR || null,
+    staleTempMs: 60 * 60 * 1000, // 게시 중 비정상 종료로 남은 .tmp 파일 정리 기준
+    retryAfterMs: 60 * 1000 // 공유 폴더 오류 후 다시 시도하기까지 대기 시간
+};
+
+// 미디어 메타데이터 추출 설정 (ffprobe / EXIF)
+const METADATA_CONFIG = {
+    concurrency: Math.max(2, Math.min(8, require('os').cpus().length)), // 동시 ffprobe/sharp 작업 수
+    ffprobeTimeoutMs: 15000, // 파일당 ffprobe 제한 시간
+    ffprobeRetryMs: 5 * 60 * 1000, // ffprobe 를 찾지 못했을 때 다시 확인하기까지 대기 시간
+    maxEntries: 100000, // 영구 캐시 최대 항목 수
+    saveDelayMs: 2000 // 저장 디바운스
+};
+
+// ===== 런타임 메트릭 (Prometheus 텍스트 포맷) + 요청 단위 트레이싱 =====
+const METRICS_CONFIG = {
+    prefix: 'media_explorer_',
+    // 초 단위 지연 버킷 (5ms ~ 30s)
+    latencyBuckets: [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30],
+    traceHistorySize: 50, // /api/traces 에 보관할 최근 트레이스 수
+    eventLoopWindowMs: 10000, // 이벤트 루프 지연 집계 윈도우 (스크레이프와 무관하게 고정)
+    tracingEnabled: process.env.MEDIA_EXPLORER_TRACE === '1' // 전체 요청 트레이싱 (기본: x-trace 헤더 요청만)
+};
+
+const metricsRegistry = new Map();
+const traceStorage = new AsyncLocalStorage();
+const recentTraces = [];
+const eventLoopDelay = monitorEventLoopDelay({ resolution: 20 });
+eventLoopDelay.enable();
+
+// 이벤트 루프 지연 (초): 고정 윈도우가 끝날 때마다 스냅샷을 남기고 초기화
+// 스크레이프는 값을 읽기만 하므로 런처와 다른 수집기가 동시에 읽어도 윈도우가 쪼개지지 않음
+function readEventLoopDelay() {
+    const snapshot = {};
+    for (const quantile of [0.5, 0.95, 0.99]) {
+        snapshot[quantile] = eventLoopDelay.percentile(quantile * 100) / 1e9;
+    }
+    snapshot.max = eventLoopDelay.max / 1e9;
+    return snapshot;
+}
+
+let eventLoopLagSnapshot = null;
+setInterval(() => {
+    eventLoopLagSnapshot = readEventLoopDelay();
+    eventLoopDelay.reset();
+}, METRICS_CONFIG.eventLoopWindowMs).unref();
+let httpRequestsInFlight = 0;
+let metadataQueueDepth = 0;
+
+// 라벨 객체 -> 정렬된 Prometheus 라벨 문자열
+function formatMetricLabels(labels) {
+    return Object.keys(labels)
+        .sort()
+        .map(key => `${key}="${String(labels[key]).replace(/\\/g, '\\\\').replace(/"/g, '\\"').replace(/\n/g, '\\n')}"`)
+        .join(',');
+}
+
+function registerMetric(type, name, help, extra = {}) {
+    const metric = { type, name: METRICS_CONFIG.prefix + name, help, values: new Map(), ...extra };
+    metricsRegistry.set(metric.name, metric);
+    return metric;
+}
+
+function createCounter(name, help) {
+    return registerMetric('counter', name, help);
+}
+
+function createHistogram(name, help, buckets = METRICS_CONFIG.latencyBuckets) {
+    return registerMetric('histogram', name, help, { buckets });
+}
+
+// collect: 스크레이프 시점에 [{ labels, value }] 또는 숫자를 반환
+function createGauge(name, help, collect = null) {
+    return registerMetric('gauge', name, help, { collect });
+}
+
+function incCounter(metric, labels = {}, value = 1) {
+    const key = formatMetricLabels(labels);
+    metric.values.set(key, (metric.values.get(key) || 0) + value);
+}
+
+function getCounterValue(metric, labels = {}) {
+    return metric.values.get(formatMetricLabels(labels)) || 0;
+}
+
+function setGauge(metric, labels = {}, value) {
+    metric.values.set(formatMetricLabels(labels), value);
+}
+
+function observeHistogram(metric, labels, value) {
+    const key = formatMetricLabels(labels);
+    let series = metric.values.get(key);
+    if (!series) {
+        series = { buckets: new Array(metric.buckets.length).fill(0), sum: 0, count: 0 };
+        metric.values.set(key, series);
+    }
+    
+    const bucketIndex = metric.buckets.findIndex(bound => value <= bound);
+    if (bucketIndex !== -1) {
+        series.buckets[bucketIndex]++;
+    }
+    series.sum += value;
+    series.count++;
+}
+
+// 지연 측정 타이머 (트레이싱 중인 요청이면 스팬으로도 기록)
+function startTimer(histogram, labels = {}) {
+    const start = performance.now();
+    const trace = traceStorage.getStore();
+    
+    return (extraLabels = {}) => {
+        const durationMs = performance.now() - start;
+        const finalLabels = { ...labels, ...extraLabels };
+        observeHistogram(histogram, finalLabels, durationMs / 1000);
+        
+        if (trace) {
+            trace.spans.push({
+                name: histogram.name.slice(METRICS_CONFIG.prefix.length),
+                labels: finalLabels,
+                startMs: Math.round((start - trace.start) * 100) / 100,
+                durationMs: Math.round(durationMs * 100) / 100
+            });
+        }
+        return durationMs;
+    };
+}
+
+// Prometheus 텍스트 노출 포맷 생성
+function renderMetrics() {
+    const lines = [];
+    
+    for (const metric of metricsRegistry.values()) {
+        lines.push(`# HELP ${metric.name} ${metric.help}`);
+        lines.push(`# TYPE ${metric.name} ${metric.type}`);
+        
+        if (metric.collect) {
+            const collected = metric.collect();
+            const samples = Array.isArray(collected) ? collected : [{ labels: {}, value: collected }];
+            for (const { labels, value } of samples) {
+                setGauge(metric, labels, value);
+            }
+        }
+        
+        for (const [labelString, value] of metric.values.entries()) {
+            if (metric.type !== 'histogram') {
+                lines.push(`${metric.name}${labelString ? `{${labelString}}` : ''} ${value}`);
+                continue;
+            }
+            
+            const prefix = labelString ? `${labelString},` : '';
+            let cumulative = 0;
+            metric.buckets.forEach((bound, index) => {
+                cumulative += value.buckets[index];
+                lines.push(`${metric.name}_bucket{${prefix}le="${bound}"} ${cumulative}`);
+            });
+            lines.push(`${metric.name}_bucket{${prefix}le="+Inf"} ${value.count}`);
+            lines.push(`${metric.name}_sum${labelString ? `{${labelString}}` : ''} ${value.sum}`);
+            lines.push(`${metric.name}_count${labelString ? `{${labelString}}` : ''} ${value.count}`);
+        }
+    }
+    
+    return lines.join('\n') + '\n';
+}
+
+// 핫 패스 메트릭
+const metrics = {
+    httpRequestDuration: createHistogram('http_request_duration_seconds', 'HTTP request latency by route'),
+    httpRequestsInFlight: createGauge('http_requests_in_flight', 'HTTP requests currently being handled',
+        () => httpRequestsInFlight),
+    scanDuration: createHistogram('scan_duration_seconds', 'Total /api/scan duration including thumbnails and metadata',
+        [0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600]),
+    scanFileDuration: createHistogram('scan_file_seconds', 'Per-file scan time (stat + thumbnail) by media type and outcome'),
+    scannedFiles: createCounter('scanned_files_total', 'Media files indexed by scans'),
+    thumbnailDuration: createHistogram('thumbnail_generation_seconds', 'Thumbnail generation latency by engine and acceleration path'),
+    thumbnailFailures: createCounter('thumbnail_failures_total', 'Thumbnail generation failures by engine'),
+    thumbnailCacheRequests: createCounter('thumbnail_cache_requests_total', 'Thumbnail cache lookups by kind and result'),
+    sharedCacheRequests: createCounter('shared_cache_requests_total', 'Shared team cache lookups by kind and result'),
+    sharedCachePublishes: createCounter('shared_cache_publishes_total', 'Thumbnails published to the shared team cache'),
+    sharedCacheDuration: createHistogram('shared_cache_seconds', 'Shared team cache copy latency by operation'),
+    metadataDuration: createHistogram('metadata_extraction_seconds', 'Metadata extraction latency by source (sharp/ffprobe)'),
+    metadataCacheRequests: createCounter('metadata_cache_requests_total', 'Metadata cache lookups by result'),
+    metadataQueueDepth: createGauge('metadata_queue_depth', 'Files waiting for metadata extraction',
+        () => metadataQueueDepth),
+    searchResults: createHistogram('search_results', 'Result count per /api/search request',
+        [0, 10, 50, 100, 500, 1000, 5000, 10000, 50000]),
+    apiResponseBytes: createCounter('api_response_bytes_total', 'Bytes sent on the wire by route, format and encoding'),
+    apiResponseRawBytes: createCounter('api_response_raw_bytes_total', 'Uncompressed JSON bytes by route, format and encoding'),
+    apiNotModified: createCounter('api_not_modified_total', 'Conditional requests answered with 304 by route'),
+    cacheFiles: createGauge('thumbnail_cache_files', 'Thumbnails tracked in the local cache',
+        () => cacheMetadata.files.size),
+    cacheBytes: createGauge('thumbnail_cache_bytes', 'Bytes used by the local thumbnail cache',
+        () => cacheMetadata.totalSize),
+    eventLoopLag: createGauge('event_loop_lag_seconds', `Event loop delay over the last completed ${METRICS_CONFIG.eventLoopWindowMs / 1000}s window`, () => {
+        // 첫 윈도우가 끝나기 전에는 시작 후 누적값
+        const snapshot = eventLoopLagSnapshot || readEventLoopDelay();
+        return Object.entries(snapshot).map(([quantile, value]) => ({ labels: { quantile }, value }));
+    }),
+    logLines: createGauge('log_lines', 'Log lines since start by outcome', () => {
+        const stats = getLoggingStats();
+        return [
+            { labels: { outcome: 'written' }, value: stats.written },
+            { labels: { outcome: 'sampled_out' }, value: stats.sampledOut },
+            { labels: { outcome: 'rate_limited' }, value: stats.rateLimited }
+        ];
+    }),
+    residentMemory: createGauge('process_resident_memory_bytes', 'Resident memory size in bytes',
+        () => process.memoryUsage().rss),
+    uptime: createGauge('process_uptime_seconds', 'Seconds since the server started',
+        () => Math.round(process.uptime()))
+};
+
 // GPU 가속 설정 캐시
 const GPU_PERFORMANCE_CACHE_FILE = path.join(CACHE_DIR, 'gpu-performance.json');
 let gpuPerformanceCache = {
@@ -68,6 +357,12 @@ let cacheMetadata = {
     lastCleanup: Date.now()
 };
 
+// 미디어 메타데이터 캐시 (썸네일과 동일한 캐시 키 -> 해상도/길이/코덱/카메라/촬영일)
+let mediaMetadataCache = {
+    entries: new Map(),
+    saveTimer: null
+};
+
 // 시스템 핑거프린트 생성 (하드웨어 변경 감지용)
 function generateSystemFingerprint() {
     const os = require('os');
@@ -149,7 +444,7 @@ function shouldSkipGPUDetection() {
         const recentDetection = gpuPerformanceCache.lastDetection > hourAgo;
         
         if (recentDetection) {
-            console.log(`💾 Using cached GPU setting: ${gpuPerformanceCache.optimalAccelerator}`);
+            log.ffmpeg.debug('Using cached GPU setting', { accelerator: gpuPerformanceCache.optimalAccelerator });
             return true;
         }
     }
@@ -234,6 +529,9 @@ async function loadCacheMetadata() {
     
     // GPU 성능 캐시도 로드
     await loadGPUPerformanceCache();
+    
+    // 미디어 메타데이터 캐시도 로드
+    await loadMediaMetadataCache();
 }
 
 // 캐시 메타데이터 저장
@@ -348,13 +646,13 @@ async function recordCacheFile(originalPath, thumbnailPath, cacheKey, size = 0)
         cacheMetadata.files.set(originalPath, metadata);
         cacheMetadata.totalSize += size;
         
-        console.log(`💾 캐시 매핑 저장: ${path.basename(originalPath)} -> ${cacheKey}.jpg (${metadata.cacheMethod})`);
+        log.cache.debug('Cache mapping saved', { file: originalPath, key: cacheKey, method: metadata.cacheMethod });
         
         // 비동기로 메타데이터 저장
         setImmediate(() => saveCacheMetadata());
         
     } catch (error) {
-        console.error('Error recording cache file:', error);
+        log.cache.error('Error recording cache file', { file: originalPath, error: error.message });
     }
 }
 
@@ -373,7 +671,7 @@ function touchCacheFile(originalPath) {
     const metadata = cacheMetadata.files.get(originalPath);
     if (metadata) {
         metadata.accessTime = Date.now();
-        console.log(`👆 캐시 접근 기록: ${path.basename(originalPath)}`);
+        log.cache.trace('Cache access recorded', { file: originalPath });
         // 즉시 저장하지 않고 배치로 처리 (성능상 이유)
     }
 }
@@ -390,6 +688,21 @@ async function initCacheDirectories() {
         
         console.log('✅ Cache directories initialized');
         
+        // 공유 캐시는 연결되지 않아도 로컬 캐시로 계속 동작
+        if (SHARED_CACHE_CONFIG.dir) {
+            try {
+                await fs.mkdir(SHARED_CACHE_CONFIG.dir, { recursive: true });
+                await fs.access(SHARED_CACHE_CONFIG.dir, fsSync.constants.R_OK | fsSync.constants.W_OK);
+                log.cache.info('Shared thumbnail cache enabled', { dir: SHARED_CACHE_CONFIG.dir });
+                // 폴더 수가 많은 NAS 에서도 시작을 막지 않도록 백그라운드 정리
+                cleanupStaleSharedTempFiles().catch(error => {
+                    log.cache.warn('Shared cache temp cleanup failed', { error: error.message });
+                });
+            } catch (error) {
+                markSharedCacheUnavailable(error);
+            }
+        }
+        
         // 주기적 캐시 정리 설정
         setInterval(cleanupCache, CACHE_CONFIG.cleanupIntervalMs);
         
@@ -768,8 +1081,7 @@ async function benchmarkAccelerator(accelerator, ffmpegPath = 'ffmpeg') {
 
 // 지능형 하드웨어 가속 감지 (캐시 지원)
 async function detectHardwareAcceleration(ffmpegPath = 'ffmpeg') {
-    console.log('🔍 Advanced GPU acceleration detection starting...');
-    console.log(`🔧 Using FFmpeg path: ${ffmpegPath}`);
+    log.ffmpeg.debug('GPU acceleration detection starting', { ffmpegPath });
     
     // 캐시된 설정 확인
     if (shouldSkipGPUDetection()) {
@@ -869,9 +1181,9 @@ async function detectHardwareAcceleration(ffmpegPath = 'ffmpeg') {
 async function checkFFmpegCapabilities() {
     try {
         // 기본 FFmpeg 확인
-        console.log('🔧 Checking system FFmpeg...');
+        log.ffmpeg.debug('Checking system FFmpeg');
         const versionOutput = await execPromise('ffmpeg -version');
-        console.log('✅ System FFmpeg found');
+        log.ffmpeg.debug('System FFmpeg found');
         
         const capabilities = {
             available: true,
@@ -883,25 +1195,25 @@ async function checkFFmpegCapabilities() {
         };
 
         // 하드웨어 가속 감지 (에러가 나도 FFmpeg 자체는 사용 가능)
-        console.log('🎯 Starting hardware acceleration detection...');
         try {
             const hwaccelResult = await detectHardwareAcceleration();
             if (hwaccelResult && hwaccelResult.accelerator) {
                 capabilities.hwaccel = hwaccelResult.accelerator;
-                console.log(`✅ Hardware acceleration detection completed: ${hwaccelResult.accelerator}`);
+                log.ffmpeg.debug('Hardware acceleration detection completed', { accelerator: hwaccelResult.accelerator });
             } else {
                 capabilities.hwaccel = null;
-                console.log('ℹ️ No hardware acceleration available');
+                log.ffmpeg.debug('No hardware acceleration available');
             }
         } catch (hwError) {
-            console.log('⚠️ GPU acceleration detection failed, continuing with CPU-only');
-            console.log(`   Error: ${hwError.message.split('\n')[0]}`);
+            log.ffmpeg.warn('GPU acceleration detection failed, continuing with CPU-only', {
+                error: hwError.message.split('\n')[0]
+            });
             capabilities.hwaccel = null;
         }
         
         // AVX-512 지원 확인 (CPU 기반 추정)
         const cpuinfo = require('os').cpus()[0].model;
-        console.log(`🔍 CPU Info: ${cpuinfo} (${require('os').cpus().length} cores)`);
+        log.ffmpeg.debug('CPU info', { cpu: cpuinfo, cores: require('os').cpus().length });
         
         if (cpuinfo.includes('Xeon') || cpuinfo.includes('Ryzen') || 
             cpuinfo.includes('i7') || cpuinfo.includes('i9') ||
@@ -914,18 +1226,18 @@ async function checkFFmpegCapabilities() {
             capabilities.optimized = true;
         }
 
-        console.log('🔧 FFmpeg Capabilities:', capabilities);
+        log.ffmpeg.debug('FFmpeg capabilities', capabilities);
         return capabilities;
         
     } catch (error) {
         // 시스템 FFmpeg 실패 시 runtime 폴더 확인
-        console.log('⚠️  System FFmpeg not found, checking runtime folder...');
+        log.ffmpeg.debug('System FFmpeg not found, checking runtime folder');
         
         try {
             // runtime 폴더에서 FFmpeg 검색
             const runtimeFFmpeg = await findRuntimeFFmpeg();
             if (runtimeFFmpeg) {
-                console.log(`✅ Found FFmpeg in runtime: ${runtimeFFmpeg}`);
+                log.ffmpeg.debug('Runtime FFmpeg found', { path: runtimeFFmpeg });
                 
                 // runtime FFmpeg로 버전 확인
                 const versionOutput = await execPromise(`"${runtimeFFmpeg}" -version`);
@@ -941,30 +1253,31 @@ async function checkFFmpegCapabilities() {
                 };
 
                 // Runtime FFmpeg에서도 GPU 가속 시도
-                console.log('🎯 Starting hardware acceleration detection for runtime FFmpeg...');
+                log.ffmpeg.debug('Runtime FFmpeg hardware acceleration detection starting');
                 try {
                     const hwaccelResult = await detectHardwareAcceleration(runtimeFFmpeg);
                     if (hwaccelResult && hwaccelResult.accelerator) {
                         runtimeCapabilities.hwaccel = hwaccelResult.accelerator;
-                        console.log(`✅ Runtime FFmpeg hardware acceleration detection completed: ${hwaccelResult.accelerator}`);
+                        log.ffmpeg.debug('Runtime FFmpeg hardware acceleration detection completed', { accelerator: hwaccelResult.accelerator });
                     } else {
                         runtimeCapabilities.hwaccel = null;
-                        console.log('ℹ️ No runtime FFmpeg hardware acceleration available');
+                        log.ffmpeg.debug('No runtime FFmpeg hardware acceleration available');
                     }
                 } catch (hwError) {
-                    console.log('⚠️ Runtime FFmpeg GPU acceleration detection failed');
-                    console.log(`   Error: ${hwError.message.split('\n')[0]}`);
+                    log.ffmpeg.warn('Runtime FFmpeg GPU acceleration detection failed, continuing with CPU-only', {
+                        error: hwError.message.split('\n')[0]
+                    });
                     runtimeCapabilities.hwaccel = null;
                 }
 
                 return runtimeCapabilities;
             }
         } catch (runtimeError) {
-            console.log('❌ Runtime FFmpeg also not available');
+            log.ffmpeg.debug('Runtime FFmpeg not available', { error: runtimeError.message });
         }
         
-        // 모든 방법 실패
-        console.log('💡 Solution: Run "썸네일 안만들어질 때 눌러주세요.bat" to fix FFmpeg installation');
+        // 모든 방법 실패 (해결 방법 안내는 /api/scan 에서 스캔당 한 번 출력)
+        log.ffmpeg.debug('FFmpeg not available');
         
         return { 
             available: false, 
@@ -986,7 +1299,7 @@ async function findRuntimeFFmpeg() {
         
         // runtime 폴더 존재 확인
         if (!fsSync.existsSync(runtimeDir)) {
-            console.log('⚠️ Runtime directory not found');
+            log.ffmpeg.debug('Runtime directory not found', { runtimeDir });
             return null;
         }
         
@@ -1019,16 +1332,16 @@ async function findRuntimeFFmpeg() {
         // 첫 번째로 찾은 유효한 FFmpeg 반환
         for (const ffmpegPath of possiblePaths) {
             if (fsSync.existsSync(ffmpegPath)) {
-                console.log(`📍 Found runtime FFmpeg: ${ffmpegPath}`);
+                log.ffmpeg.debug('Runtime FFmpeg path resolved', { path: ffmpegPath });
                 return ffmpegPath;
             }
         }
         
-        console.log('❌ No valid FFmpeg found in runtime directory');
+        log.ffmpeg.debug('No valid FFmpeg found in runtime directory', { runtimeDir });
         return null;
         
     } catch (error) {
-        console.log('❌ Error searching runtime FFmpeg:', error.message);
+        log.ffmpeg.warn('Error searching runtime FFmpeg', { error: error.message });
         return null;
     }
 }
@@ -1114,36 +1427,44 @@ function isNASPath(filePath) {
     return filePath.startsWith('\\\\') && filePath.includes('\\\\', 2);
 }
 
-// 파일 헤더 기반 캐시 키 생성 (NAS 환경용)
-async function generateHeaderBasedCacheKey(filePath, stats) {
-    const fileName = path.basename(filePath);
-    const startTime = Date.now();
-    
+// 파일 첫 4KB + 크기 기반 해시 (읽기 실패 시 예외)
+async function computeHeaderHash(filePath, stats) {
+    const fd = await fs.open(filePath, 'r');
     try {
-        console.log(`🌐 NAS 파일 헤더 해시 생성: ${fileName} (${(stats.size / 1024).toFixed(1)}KB)`);
-        
-        // 파일의 첫 4KB 읽기
-        const fd = await fs.open(filePath, 'r');
         const bufferSize = Math.min(4096, stats.size);
         const buffer = Buffer.alloc(bufferSize);
-        
         await fd.read(buffer, 0, bufferSize, 0);
-        await fd.close();
         
         // 헤더 해시 + 파일 크기 조합
         const headerHash = crypto.createHash('md5').update(buffer).digest('hex');
-        const finalHash = crypto.createHash('md5')
+        return crypto.createHash('md5')
             .update(`${headerHash}_${stats.size}`)
             .digest('hex');
-            
+    } finally {
+        await fd.close();
+    }
+}
+
+// 파일 헤더 기반 캐시 키 생성 (NAS 환경용)
+async function generateHeaderBasedCacheKey(filePath, stats) {
+    const fileName = path.basename(filePath);
+    const startTime = Date.now();
+    
+    try {
+        const finalHash = await computeHeaderHash(filePath, stats);
         const duration = Date.now() - startTime;
-        console.log(`  → 헤더 해시 완료: ${finalHash.substring(0, 8)}... (${duration}ms)`);
+        countScanEvent('nasHeaderHash', duration);
+        log.nas.debug('Header hash computed', { file: fileName, size: stats.size, durationMs: duration });
         return finalHash;
         
     } catch (error) {
         const duration = Date.now() - startTime;
-        console.log(`⚠️  NAS 헤더 해시 실패 (${duration}ms): ${fileName} - ${error.message}`);
-        console.log(`→ 기존 방식으로 폴백`);
+        countScanEvent('nasHeaderHashFailed', duration);
+        log.nas.warn('Header hash failed, falling back to size/mtime key', {
+            file: fileName,
+            durationMs: duration,
+            error: error.message
+        });
         
         // 읽기 실패 시 기존 방식으로 폴백
         return crypto.createHash('md5')
@@ -1173,6 +1494,200 @@ async function generateImageCacheKey(imagePath, stats) {
     }
 }
 
+// ===== 팀 공유 썸네일 캐시 (네트워크 공유 폴더) =====
+// 조회 순서: 로컬 캐시 -> 공유 캐시 -> 새로 생성 후 공유 캐시에 게시
+// 공유 캐시는 헤더 기반 키를 사용하므로 다른 PC에서도 같은 파일이면 같은 키가 됩니다.
+
+// 공유 폴더 장애 상태 (장애 중에는 조회/게시를 모두 건너뛰고 retryAfterMs 후 다시 시도)
+const sharedCacheState = {
+    unavailableUntil: 0,
+    outage: false
+};
+
+function isSharedCacheAvailable() {
+    return Boolean(SHARED_CACHE_CONFIG.dir) && Date.now() >= sharedCacheState.unavailableUntil;
+}
+
+// 장애 시작 시 한 번만 경고 (파일마다 경고하지 않음)
+function markSharedCacheUnavailable(error) {
+    sharedCacheState.unavailableUntil = Date.now() + SHARED_CACHE_CONFIG.retryAfterMs;
+    if (!sharedCacheState.outage) {
+        sharedCacheState.outage = true;
+        log.cache.warn('Shared thumbnail cache unavailable, using local cache only', {
+            dir: SHARED_CACHE_CONFIG.dir,
+            retryAfterSec: SHARED_CACHE_CONFIG.retryAfterMs / 1000,
+            error: error.message
+        });
+    }
+}
+
+function markSharedCacheAvailable() {
+    if (sharedCacheState.outage) {
+        sharedCacheState.outage = false;
+        log.cache.info('Shared thumbnail cache available again', { dir: SHARED_CACHE_CONFIG.dir });
+    }
+}
+
+// 공유 캐시 썸네일 경로 (키 앞 2자리로 폴더 분산)
+function getSharedThumbnailPath(kind, sharedKey) {
+    const kindDir = kind === 'video' ? 'video-thumbnails' : 'thumbnails';
+    return path.join(SHARED_CACHE_CONFIG.dir, kindDir, sharedKey.slice(0, 2), `${sharedKey}.jpg`);
+}
+
+// 공유 캐시 키 (항상 헤더 기반 - 헤더를 못 읽으면 null 을 반환해 공유 캐시를 건너뜀)
+// size/mtime 폴백 키는 PC마다 달라질 수 있어 다른 파일의 썸네일과 충돌할 수 있음
+async function getSharedCacheKey(kind, filePath, stats) {
+    if (!SHARED_CACHE_CONFIG.dir) {
+        return null;
+    }
+    if (!isSharedCacheAvailable()) {
+        incCounter(metrics.sharedCacheRequests, { kind, result: 'skipped' });
+        countScanEvent('sharedCacheSkipped');
+        return null;
+    }
+    
+    const startTime = Date.now();
+    try {
+        const sharedKey = await computeHeaderHash(filePath, stats);
+        countScanEvent('sharedKeyHash', Date.now() - startTime);
+        return sharedKey;
+    } catch (error) {
+        countScanEvent('sharedKeyHashFailed', Date.now() - startTime);
+        log.cache.debug('Shared cache key unavailable, skipping shared cache', {
+            kind,
+            file: path.basename(filePath),
+            error: error.message
+        });
+        return null;
+    }
+}
+
+// 임시 파일에 쓴 뒤 rename (읽는 쪽에서 절반만 쓰인 파일을 볼 수 없음)
+async function copyFileAtomic(sourcePath, targetPath) {
+    const tempPath = `${targetPath}.${os.hostname()}-${process.pid}-${crypto.randomBytes(4).toString('hex')}.tmp`;
+    try {
+        await fs.copyFile(sourcePath, tempPath);
+        await fs.rename(tempPath, targetPath);
+        return true;
+    } catch (error) {
+        await fs.unlink(tempPath).catch(() => {});
+        // 다른 PC가 같은 키를 먼저 게시해 대상 파일이 열려 있는 경우 (Windows rename 의 EPERM/EBUSY)
+        try {
+            await fs.access(targetPath);
+            return false;
+        } catch {
+            throw error;
+        }
+    }
+}
+
+// 공유 캐시에서 로컬 캐시로 가져오기
+async function fetchFromSharedCache(kind, sharedKey, localThumbnailPath) {
+    if (!sharedKey || !isSharedCacheAvailable()) {
+        return false;
+    }
+    
+    const sharedPath = getSharedThumbnailPath(kind, sharedKey);
+    const endTimer = startTimer(metrics.sharedCacheDuration, { kind, operation: 'fetch' });
+    try {
+        await copyFileAtomic(sharedPath, localThumbnailPath);
+        endTimer();
+        incCounter(metrics.sharedCacheRequests, { kind, result: 'hit' });
+        countScanEvent('sharedCacheHit');
+        markSharedCacheAvailable();
+        log.cache.debug('Shared cache hit', { kind, key: sharedKey });
+        return true;
+    } catch (error) {
+        incCounter(metrics.sharedCacheRequests, { kind, result: error.code === 'ENOENT' ? 'miss' : 'error' });
+        if (error.code === 'ENOENT') {
+            markSharedCacheAvailable();
+        } else {
+            markSharedCacheUnavailable(error);
+            log.cache.debug('Shared cache read failed', { kind, key: sharedKey, error: error.message });
+        }
+        return false;
+    }
+}
+
+// 새로 만든 썸네일을 공유 캐시에 게시 (스캔을 막지 않도록 호출 측은 기다리지 않음)
+async function publishToSharedCache(kind, sharedKey, localThumbnailPath) {
+    if (!sharedKey || !isSharedCacheAvailable()) {
+        return;
+    }
+    
+    const sharedPath = getSharedThumbnailPath(kind, sharedKey);
+    try {
+        // 이미 게시된 키는 복사하지 않음
+        try {
+            await fs.access(sharedPath);
+            return;
+        } catch (error) {
+            if (error.code !== 'ENOENT') {
+                throw error;
+            }
+        }
+        await fs.mkdir(path.dirname(sharedPath), { recursive: true });
+        const published = await copyFileAtomic(localThumbnailPath, sharedPath);
+        incCounter(metrics.sharedCachePublishes, { kind, result: published ? 'published' : 'exists' });
+        if (published) {
+            countScanEvent('sharedCachePublished');
+        }
+        markSharedCacheAvailable();
+    } catch (error) {
+        incCounter(metrics.sharedCachePublishes, { kind, result: 'error' });
+        // ENOENT 는 로컬 썸네일이 먼저 정리된 경우 - 공유 폴더 장애가 아님
+        if (error.code !== 'ENOENT') {
+            markSharedCacheUnavailable(error);
+        }
+        log.cache.debug('Shared cache publish failed', { kind, key: sharedKey, error: error.message });
+    }
+}
+
+// 비정상 종료된 게시자가 남긴 임시 파일 정리 (진행 중인 다른 PC의 게시와 겹치지 않도록 오래된 것만)
+async function cleanupStaleSharedTempFiles() {
+    const cutoff = Date.now() - SHARED_CACHE_CONFIG.staleTempMs;
+    let removed = 0;
+    
+    for (const kindDir of ['thumbnails', 'video-thumbnails']) {
+        const kindPath = path.join(SHARED_CACHE_CONFIG.dir, kindDir);
+        let prefixDirs;
+        try {
+            prefixDirs = await fs.readdir(kindPath);
+        } catch {
+            continue;
+        }
+        
+        for (const prefixDir of prefixDirs) {
+            let entries;
+            try {
+                entries = await fs.readdir(path.join(kindPath, prefixDir));
+            } catch {
+                continue;
+            }
+            
+            for (const entry of entries) {
+                if (!entry.endsWith('.tmp')) {
+                    continue;
+                }
+                const tempPath = path.join(kindPath, prefixDir, entry);
+                try {
+                    const stats = await fs.stat(tempPath);
+                    if (stats.mtimeMs < cutoff) {
+                        await fs.unlink(tempPath);
+                        removed++;
+                    }
+                } catch {
+                    // 다른 PC가 먼저 정리했거나 rename 된 파일
+                }
+            }
+        }
+    }
+    
+    if (removed > 0) {
+        log.cache.info('Removed stale shared cache temp files', { removed });
+    }
+}
+
 // 향상된 비디오 썸네일 생성
 async function generateVideoThumbnail(videoPath) {
     const startTime = Date.now();
@@ -1187,47 +1702,68 @@ async function generateVideoThumbnail(videoPath) {
         try {
             await fs.access(thumbnailPath);
             const cacheTime = Date.now() - startTime;
-            console.log(`⚡ Cache hit: ${videoPath} (${cacheTime}ms)`);
+            incCounter(metrics.thumbnailCacheRequests, { kind: 'video', result: 'hit' });
+            countScanEvent('videoThumbnailHit');
+            log.thumbnail.debug('Video cache hit', { file: videoPath, durationMs: cacheTime });
             return `/api/serve-video-thumbnail/${cacheKey}.jpg`;
         } catch {
             // 캐시 미스, 새로 생성
+            incCounter(metrics.thumbnailCacheRequests, { kind: 'video', result: 'miss' });
+            countScanEvent('videoThumbnailMiss');
+        }
+        
+        // 공유 캐시 확인 (다른 PC에서 이미 만든 썸네일)
+        const sharedKey = await getSharedCacheKey('video', videoPath, stats);
+        if (await fetchFromSharedCache('video', sharedKey, thumbnailPath)) {
+            await recordCacheFile(videoPath, thumbnailPath, cacheKey);
+            return `/api/serve-video-thumbnail/${cacheKey}.jpg`;
         }
         
         // 2단계: FFmpeg 능력 확인
         const capabilities = await checkFFmpegCapabilities();
         if (!capabilities.available) {
-            console.log('❌ FFmpeg not available');
+            log.thumbnail.debug('FFmpeg not available', { file: videoPath });
             return null;
         }
         
         // 3단계: 최적화된 명령어로 썸네일 생성
         const command = buildOptimizedFFmpegCommand(videoPath, thumbnailPath, capabilities);
         
-        console.log(`🚀 Generating optimized thumbnail: ${path.basename(videoPath)}`);
-        console.log(`🔧 Command: ${command}`);
+        log.thumbnail.debug('Generating video thumbnail', { file: videoPath, command });
+        
+        const endFFmpegTimer = startTimer(metrics.thumbnailDuration, {
+            engine: 'ffmpeg',
+            accel: capabilities.hwaccel || 'cpu'
+        });
         
         try {
             await execPromise(command);
+            const generateTime = endFFmpegTimer();
             const totalTime = Date.now() - startTime;
+            countScanEvent('videoThumbnailGenerated', generateTime);
             
             // 생성된 캐시 파일 기록
             await recordCacheFile(videoPath, thumbnailPath, cacheKey);
+            publishToSharedCache('video', sharedKey, thumbnailPath);
             
-            console.log(`✅ Thumbnail generated: ${path.basename(videoPath)} (${totalTime}ms)`);
-            console.log(`   - Hardware: ${capabilities.hwaccel || 'CPU'}`);
-            console.log(`   - Threads: ${capabilities.threads}`);
-            console.log(`   - AVX-512: ${capabilities.avx512 ? 'Yes' : 'No'}`);
-            console.log(`   - FFmpeg Source: ${capabilities.source}`);
-            console.log(`   - Performance: ${totalTime < 50 ? '🚀🚀 Ultra Fast' : totalTime < 200 ? '🚀 Fast' : totalTime < 1000 ? '⚡ Good' : totalTime < 3000 ? '🐢 Moderate' : '🐌 Slow'}`);
+            log.thumbnail.debug('Video thumbnail generated', {
+                file: videoPath,
+                durationMs: totalTime,
+                hwaccel: capabilities.hwaccel || 'cpu',
+                threads: capabilities.threads,
+                source: capabilities.source
+            });
             
-            // 향상된 성능 분석 및 제안
-            if (capabilities.hwaccelDetails && capabilities.hwaccelDetails.alternatives.length > 0) {
+            // 향상된 성능 분석 및 제안 (느린 파일만 상세 출력)
+            if (log.thumbnail.isEnabled('debug') && capabilities.hwaccelDetails && capabilities.hwaccelDetails.alternatives.length > 0) {
                 const currentPerf = totalTime;
                 const alternatives = capabilities.hwaccelDetails.alternatives;
                 const betterAlts = alternatives.filter(alt => alt.benchmark && alt.benchmark.duration < currentPerf);
                 
                 if (betterAlts.length > 0) {
-                    console.log(`   💡 Better alternatives available: ${betterAlts.map(alt => `${alt.name} (${alt.benchmark.duration}ms)`).join(', ')}`);
+                    log.thumbnail.debug('Better accelerators available', {
+                        alternatives: betterAlts.map(alt => `${alt.name} (${alt.benchmark.duration}ms)`)
+                    });
                 }
             }
             
@@ -1244,40 +1780,51 @@ async function generateVideoThumbnail(videoPath) {
                 }
                 
                 if (suggestions.length > 0) {
-                    console.log(`   💡 Performance tips: ${suggestions.join(', ')}`);
+                    log.thumbnail.debug('Slow video thumbnail', { file: videoPath, durationMs: totalTime, suggestions });
                 }
             }
             
             return `/api/serve-video-thumbnail/${cacheKey}.jpg`;
             
         } catch (error) {
-            console.error(`❌ Optimized generation failed: ${error.message}`);
+            incCounter(metrics.thumbnailFailures, { engine: 'ffmpeg', accel: capabilities.hwaccel || 'cpu' });
+            log.thumbnail.warn('Optimized generation failed, falling back to basic FFmpeg', {
+                file: videoPath,
+                error: error.message.split('\n')[0]
+            });
             
             // 4단계: Fallback - 기본 FFmpeg 명령어
-            console.log('🔄 Falling back to basic FFmpeg...');
             const ffmpegExe = capabilities.source === 'runtime' && capabilities.path 
                 ? `"${capabilities.path}"` 
                 : 'ffmpeg';
             const fallbackCommand = `${ffmpegExe} -i "${videoPath}" -ss 00:00:01.000 -vframes 1 -an -sn -vf "scale=200:200:force_original_aspect_ratio=decrease:flags=fast_bilinear,pad=200:200:(ow-iw)/2:(oh-ih)/2" -q:v 5 -preset ultrafast "${thumbnailPath}" -y -v error`;
             
+            const endFallbackTimer = startTimer(metrics.thumbnailDuration, { engine: 'ffmpeg', accel: 'fallback' });
             try {
                 await execPromise(fallbackCommand);
+                const generateTime = endFallbackTimer();
                 const totalTime = Date.now() - startTime;
+                countScanEvent('videoThumbnailGenerated', generateTime);
                 
                 // 생성된 캐시 파일 기록
                 await recordCacheFile(videoPath, thumbnailPath, cacheKey);
+                publishToSharedCache('video', sharedKey, thumbnailPath);
                 
-                console.log(`✅ Fallback successful: ${path.basename(videoPath)} (${totalTime}ms)`);
-                console.log(`   - Used: Basic CPU encoding (fallback mode)`);
+                log.thumbnail.debug('Fallback thumbnail generated', { file: videoPath, durationMs: totalTime });
                 return `/api/serve-video-thumbnail/${cacheKey}.jpg`;
             } catch (fallbackError) {
-                console.error('❌ Fallback also failed:', fallbackError.message);
+                incCounter(metrics.thumbnailFailures, { engine: 'ffmpeg', accel: 'fallback' });
+                countScanEvent('videoThumbnailFailed');
+                log.thumbnail.warn('Fallback thumbnail generation failed', {
+                    file: videoPath,
+                    error: fallbackError.message.split('\n')[0]
+                });
                 return null;
             }
         }
         
     } catch (error) {
-        console.error('❌ Error in video thumbnail generation:', error.message);
+        log.thumbnail.error('Error in video thumbnail generation', { file: videoPath, error: error.message });
         return null;
     }
 }
@@ -1303,18 +1850,31 @@ async function generateImageThumbnail(imagePath) {
             try {
                 // 실제 썸네일 파일 존재 확인
                 await fs.access(cachedInfo.thumbnailPath);
-                console.log(`🟢 캐시 HIT: ${path.basename(imagePath)} -> ${hash}.jpg (${cachedInfo.cacheMethod})`);
+                incCounter(metrics.thumbnailCacheRequests, { kind: 'image', result: 'hit' });
+                countScanEvent('imageThumbnailHit');
+                log.thumbnail.debug('Image cache hit', { file: imagePath, key: hash, method: cachedInfo.cacheMethod });
                 touchCacheFile(imagePath); // 캐시 접근 기록
                 return `/api/serve-thumbnail/${hash}.jpg`;
             } catch {
                 // 썸네일 파일이 삭제된 경우 캐시 엔트리 제거
-                console.log(`⚠️ 캐시 엔트리 제거: ${path.basename(imagePath)} (썸네일 파일 없음)`);
+                log.cache.debug('Cache entry removed (thumbnail file missing)', { file: imagePath });
                 cacheMetadata.files.delete(imagePath);
             }
         }
         
         // 캐시 MISS - 새로 생성
-        console.log(`🔴 캐시 MISS: ${path.basename(imagePath)} - 새로 생성`);
+        incCounter(metrics.thumbnailCacheRequests, { kind: 'image', result: 'miss' });
+        countScanEvent('imageThumbnailMiss');
+        log.thumbnail.debug('Image cache miss', { file: imagePath });
+        
+        // 공유 캐시 확인 (다른 PC에서 이미 만든 썸네일)
+        const sharedKey = await getSharedCacheKey('image', imagePath, stats);
+        if (await fetchFromSharedCache('image', sharedKey, thumbnailPath)) {
+            await recordCacheFile(imagePath, thumbnailPath, hash);
+            return `/api/serve-thumbnail/${hash}.jpg`;
+        }
+        
+        const endSharpTimer = startTimer(metrics.thumbnailDuration, { engine: 'sharp', accel: 'cpu' });
         try {
             // HEIC 파일 처리
             if (ext === '.heic' || ext === '.heif') {
@@ -1327,26 +1887,37 @@ async function generateImageThumbnail(imagePath) {
                         })
                         .jpeg({ quality: 85 })
                         .toFile(thumbnailPath);
+                    countScanEvent('imageThumbnailGenerated', endSharpTimer());
                     
                     await recordCacheFile(imagePath, thumbnailPath, hash); // 캐시 파일 기록
-                    console.log(`✅ HEIC 썸네일 생성 완료: ${path.basename(imagePath)}`);
+                    publishToSharedCache('image', sharedKey, thumbnailPath);
+                    log.thumbnail.debug('HEIC thumbnail generated', { file: imagePath });
                     return `/api/serve-thumbnail/${hash}.jpg`;
                 } catch (heicError) {
-                    console.log('HEIC thumbnail generation failed, trying with sips (macOS) or convert...');
+                    incCounter(metrics.thumbnailFailures, { engine: 'sharp', accel: 'cpu' });
+                    log.thumbnail.debug('HEIC thumbnail generation failed, trying sips', {
+                        file: imagePath,
+                        error: heicError.message
+                    });
                     
                     // macOS의 경우 sips 사용
                     if (process.platform === 'darwin') {
+                        const endSipsTimer = startTimer(metrics.thumbnailDuration, { engine: 'sips', accel: 'cpu' });
                         try {
                             const tempPath = thumbnailPath.replace('.jpg', '_temp.jpg');
                             await execPromise(`sips -s format jpeg "${imagePath}" --out "${tempPath}" --resampleHeightWidthMax 200`);
                             await fs.rename(tempPath, thumbnailPath);
+                            countScanEvent('imageThumbnailGenerated', endSipsTimer());
                             await recordCacheFile(imagePath, thumbnailPath, hash); // 캐시 파일 기록
+                            publishToSharedCache('image', sharedKey, thumbnailPath);
                             return `/api/serve-thumbnail/${hash}.jpg`;
                         } catch (sipsError) {
-                            console.error('HEIC conversion with sips failed:', sipsError.message);
+                            incCounter(metrics.thumbnailFailures, { engine: 'sips', accel: 'cpu' });
+                            log.thumbnail.warn('HEIC conversion with sips failed', { file: imagePath, error: sipsError.message });
                         }
                     }
                     
+                    countScanEvent('imageThumbnailFailed');
                     return null;
                 }
             }
@@ -1359,13 +1930,20 @@ async function generateImageThumbnail(imagePath) {
                 })
                 .jpeg({ quality: 85 })
                 .toFile(thumbnailPath);
+            countScanEvent('imageThumbnailGenerated', endSharpTimer());
             
             await recordCacheFile(imagePath, thumbnailPath, hash); // 캐시 파일 기록
-            console.log(`✅ 일반 이미지 썸네일 생성 완료: ${path.basename(imagePath)}`);
+            publishToSharedCache('image', sharedKey, thumbnailPath);
+            log.thumbnail.debug('Image thumbnail generated', { file: imagePath });
             return `/api/serve-thumbnail/${hash}.jpg`;
+        } catch (generateError) {
+            incCounter(metrics.thumbnailFailures, { engine: 'sharp', accel: 'cpu' });
+            countScanEvent('imageThumbnailFailed');
+            log.thumbnail.warn('Image thumbnail generation failed', { file: imagePath, error: generateError.message });
+            return null;
         }
     } catch (error) {
-        console.error('Error generating image thumbnail:', error.message);
+        log.thumbnail.error('Error generating image thumbnail', { file: imagePath, error: error.message });
         return null;
     }
 }
@@ -1408,7 +1986,7 @@ function isMediaFile(filename) {
 }
 
 // Scan directory with thumbnail generation - NFC 정규화 추가
-async function scanDirectory(dirPath, baseDir = dirPath, maxDepth = 5, currentDepth = 0) {
+async function scanDirectory(dirPath, baseDir = dirPath, maxDepth = 5, currentDepth = 0, metadataJobs = null) {
     const files = [];
     
     if (currentDepth >= maxDepth) {
@@ -1431,48 +2009,548 @@ async function scanDirectory(dirPath, baseDir = dirPath, maxDepth = 5, currentDe
             
             try {
                 if (entry.isDirectory()) {
-                    const subFiles = await scanDirectory(fullPath, baseDir, maxDepth, currentDepth + 1);
+                    const subFiles = await scanDirectory(fullPath, baseDir, maxDepth, currentDepth + 1, metadataJobs);
                     files.push(...subFiles);
                 } else if (entry.isFile()) {
                     const mediaInfo = isMediaFile(entry.name);
                     if (mediaInfo.isMedia) {
-                        const stats = await fs.stat(fullPath);
-                        const relativePath = path.relative(baseDir, path.dirname(fullPath));
-                        
-                        // NFC 정규화를 적용하여 파일 정보 저장
-                        const fileInfo = {
-                            filename: entry.name.normalize('NFC'),  // 한글 정규화
-                            path: (relativePath || '.').normalize('NFC'),  // 한글 정규화
-                            fullPath: fullPath.normalize('NFC'),  // 한글 정규화
-                            size: stats.size,
-                            type: `${mediaInfo.type}/${mediaInfo.extension}`,
-                            extension: mediaInfo.extension,
-                            modifiedAt: stats.mtime.toISOString(),
-                            mediaType: mediaInfo.type,
-                            thumbnailUrl: null
-                        };
-                        
-                        // Generate thumbnail based on media type (HEIC 포함)
-                        if (mediaInfo.type === 'image') {
-                            fileInfo.thumbnailUrl = await generateImageThumbnail(fullPath);
-                        } else if (mediaInfo.type === 'video') {
-                            fileInfo.thumbnailUrl = await generateVideoThumbnail(fullPath);
+                        const endFileTimer = startTimer(metrics.scanFileDuration, { media_type: mediaInfo.type });
+                        // 실패한 파일(stat/썸네일 오류)도 처리 시간 분포에 포함
+                        let outcome = 'error';
+                        try {
+                            const stats = await fs.stat(fullPath);
+                            const relativePath = path.relative(baseDir, path.dirname(fullPath));
+                            
+                            // NFC 정규화를 적용하여 파일 정보 저장
+                            const fileInfo = {
+                                filename: entry.name.normalize('NFC'),  // 한글 정규화
+                                path: (relativePath || '.').normalize('NFC'),  // 한글 정규화
+                                fullPath: fullPath.normalize('NFC'),  // 한글 정규화
+                                size: stats.size,
+                                type: `${mediaInfo.type}/${mediaInfo.extension}`,
+                                extension: mediaInfo.extension,
+                                modifiedAt: stats.mtime.toISOString(),
+                                mediaType: mediaInfo.type,
+                                thumbnailUrl: null,
+                                metadata: null
+                            };
+                            
+                            // Generate thumbnail based on media type (HEIC 포함)
+                            if (mediaInfo.type === 'image') {
+                                fileInfo.thumbnailUrl = await generateImageThumbnail(fullPath);
+                            } else if (mediaInfo.type === 'video') {
+                                fileInfo.thumbnailUrl = await generateVideoThumbnail(fullPath);
+                            }
+                            
+                            // 메타데이터는 스캔 후 워커 풀에서 일괄 추출
+                            if (metadataJobs && ['image', 'video', 'audio'].includes(mediaInfo.type)) {
+                                metadataJobs.push({ fileInfo, stats, mediaType: mediaInfo.type });
+                            }
+                            
+                            files.push(fileInfo);
+                            outcome = 'ok';
+                            incCounter(metrics.scannedFiles, { media_type: mediaInfo.type });
+                        } finally {
+                            endFileTimer({ outcome });
                         }
-                        
-                        files.push(fileInfo);
                     }
                 }
             } catch (error) {
+                log.scan.debug('Error scanning file', { file: fullPath, error: error.message });
                 continue;
             }
         }
     } catch (error) {
-        console.error(`Error scanning directory ${dirPath}:`, error.message);
+        log.scan.warn('Error scanning directory', { dir: dirPath, error: error.message });
     }
     
     return files;
 }
 
+// ===== 미디어 메타데이터 추출 (ffprobe 배치 + sharp EXIF + 영구 캐시) =====
+
+// 검색 API에 노출되는 메타데이터 필드
+const MEDIA_METADATA_FIELDS = ['width', 'height', 'duration', 'codec', 'camera', 'capturedAt'];
+
+// ffprobe 실행 파일 경로 (undefined: 아직 확인 안 함, null: 사용 불가, 셸을 거치지 않고 execFile 로 실행)
+let ffprobeCommand;
+let ffprobeCheckedAt = 0;
+
+// 미디어 메타데이터 캐시 로드
+async function loadMediaMetadataCache() {
+    try {
+        if (fsSync.existsSync(MEDIA_METADATA_FILE)) {
+            const data = JSON.parse(await fs.readFile(MEDIA_METADATA_FILE, 'utf-8'));
+            mediaMetadataCache.entries = new Map(data.entries || []);
+            console.log(`🎞️ Media metadata cache loaded: ${mediaMetadataCache.entries.size} entries`);
+        }
+    } catch (error) {
+        console.log('ℹ️  Creating new media metadata cache');
+        mediaMetadataCache.entries = new Map();
+    }
+}
+
+// 미디어 메타데이터 캐시 저장 (오래된 항목부터 정리)
+async function saveMediaMetadataCache() {
+    try {
+        if (mediaMetadataCache.entries.size > METADATA_CONFIG.maxEntries) {
+            const sortedEntries = Array.from(mediaMetadataCache.entries.entries())
+                .sort((a, b) => a[1].accessTime - b[1].accessTime);
+            const overflow = sortedEntries.length - METADATA_CONFIG.maxEntries;
+            for (let i = 0; i < overflow; i++) {
+                mediaMetadataCache.entries.delete(sortedEntries[i][0]);
+            }
+        }
+        
+        const data = {
+            entries: Array.from(mediaMetadataCache.entries.entries())
+        };
+        await fs.writeFile(MEDIA_METADATA_FILE, JSON.stringify(data));
+    } catch (error) {
+        console.error('Error saving media metadata cache:', error);
+    }
+}
+
+// 저장 요청을 모아서 한 번에 처리 (스캔 중 반복 쓰기 방지)
+function scheduleMediaMetadataSave() {
+    if (mediaMetadataCache.saveTimer) {
+        return;
+    }
+    mediaMetadataCache.saveTimer = setTimeout(async () => {
+        mediaMetadataCache.saveTimer = null;
+        await saveMediaMetadataCache();
+    }, METADATA_CONFIG.saveDelayMs);
+}
+
+// 썸네일 캐시와 동일한 방식의 메타데이터 캐시 키 (파일 변경 시에만 다시 추출)
+async function generateMetadataCacheKey(filePath, stats, mediaType) {
+    if (mediaType === 'image') {
+        return await generateImageCacheKey(filePath, stats);
+    }
+    return await generateCacheKey(filePath, stats);
+}
+
+// 제한된 수의 워커로 작업 목록 처리
+async function runWorkerPool(items, concurrency, worker) {
+    let nextIndex = 0;
+    const workerCount = Math.min(concurrency, items.length);
+    const workers = Array.from({ length: workerCount }, async () => {
+        while (nextIndex < items.length) {
+            const index = nextIndex++;
+            await worker(items[index], index);
+        }
+    });
+    await Promise.all(workers);
+}
+
+// ffprobe 실행 파일 확인 (runtime 폴더의 FFmpeg 옆 ffprobe 우선)
+// 찾지 못한 경우 ffprobeRetryMs 후 다시 확인 (서버 재시작 없이 설치 반영)
+async function resolveFFprobeCommand(capabilities) {
+    if (ffprobeCommand) {
+        return ffprobeCommand;
+    }
+    if (ffprobeCommand === null && Date.now() - ffprobeCheckedAt < METADATA_CONFIG.ffprobeRetryMs) {
+        return null;
+    }
+    const firstCheck = ffprobeCommand === undefined;
+    ffprobeCheckedAt = Date.now();
+    
+    const candidates = [];
+    if (capabilities && capabilities.source === 'runtime' && capabilities.path) {
+        const executableName = process.platform === 'win32' ? 'ffprobe.exe' : 'ffprobe';
+        const runtimeFFprobe = path.join(path.dirname(capabilities.path), executableName);
+        if (fsSync.existsSync(runtimeFFprobe)) {
+            candidates.push(runtimeFFprobe);
+        }
+    }
+    candidates.push('ffprobe');
+    
+    for (const candidate of candidates) {
+        try {
+            await execFilePromise(candidate, ['-version']);
+            console.log(`✅ ffprobe available: ${candidate}`);
+            ffprobeCommand = candidate;
+            return ffprobeCommand;
+        } catch {
+            // 다음 후보 확인
+        }
+    }
+    
+    if (firstCheck) {
+        console.log('⚠️ ffprobe not found. Video/audio metadata will be extracted once it is installed.');
+    }
+    ffprobeCommand = null;
+    return ffprobeCommand;
+}
+
+// 날짜 문자열을 ISO 형식으로 정규화 (EXIF "YYYY:MM:DD HH:MM:SS" 포함)
+function normalizeCaptureDate(value) {
+    if (!value) {
+        return null;
+    }
+    
+    const exifMatch = /^(\d{4}):(\d{2}):(\d{2})[ T](\d{2}):(\d{2}):(\d{2})/.exec(String(value).trim());
+    const date = exifMatch
+        ? new Date(+exifMatch[1], +exifMatch[2] - 1, +exifMatch[3], +exifMatch[4], +exifMatch[5], +exifMatch[6])
+        : new Date(value);
+    
+    // 0000:00:00 같은 빈 값은 무시
+    if (isNaN(date.getTime()) || date.getFullYear() < 1900) {
+        return null;
+    }
+    return date.toISOString();
+}
+
+// 카메라 제조사/모델 결합 ("Canon" + "Canon EOS R5" -> "Canon EOS R5")
+function formatCameraName(make, model) {
+    const cleanMake = (make || '').trim();
+    const cleanModel = (model || '').trim();
+    if (!cleanModel) {
+        return cleanMake || null;
+    }
+    if (!cleanMake || cleanModel.toLowerCase().startsWith(cleanMake.toLowerCase())) {
+        return cleanModel;
+    }
+    return `${cleanMake} ${cleanModel}`;
+}
+
+// sharp가 반환하는 EXIF 버퍼에서 카메라/촬영일 태그만 읽기
+function parseExifBuffer(buffer) {
+    const result = { make: null, model: null, dateTime: null, dateTimeOriginal: null };
+    
+    try {
+        // "Exif\0\0" 헤더 다음부터 TIFF 구조
+        const base = buffer.toString('binary', 0, 6) === 'Exif\0\0' ? 6 : 0;
+        const byteOrder = buffer.toString('binary', base, base + 2);
+        if (byteOrder !== 'II' && byteOrder !== 'MM') {
+            return result;
+        }
+        const little = byteOrder === 'II';
+        const readUInt16 = offset => little ? buffer.readUInt16LE(offset) : buffer.readUInt16BE(offset);
+        const readUInt32 = offset => little ? buffer.readUInt32LE(offset) : buffer.readUInt32BE(offset);
+        
+        const readAscii = (entryOffset) => {
+            const count = readUInt32(entryOffset + 4);
+            const valueOffset = count <= 4 ? entryOffset + 8 : base + readUInt32(entryOffset + 8);
+            if (valueOffset + count > buffer.length) {
+                return null;
+            }
+            return buffer.toString('latin1', valueOffset, valueOffset + count).replace(/\0+$/, '').trim() || null;
+        };
+        
+        const readIFD = (ifdOffset, handler) => {
+            const start = base + ifdOffset;
+            if (start + 2 > buffer.length) {
+                return;
+            }
+            const entryCount = readUInt16(start);
+            for (let i = 0; i < entryCount; i++) {
+                const entryOffset = start + 2 + i * 12;
+                if (entryOffset + 12 > buffer.length) {
+                    break;
+                }
+                handler(readUInt16(entryOffset), entryOffset);
+            }
+        };
+        
+        let exifIFDOffset = null;
+        readIFD(readUInt32(base + 4), (tag, entryOffset) => {
+            if (tag === 0x010F) result.make = readAscii(entryOffset);
+            else if (tag === 0x0110) result.model = readAscii(entryOffset);
+            else if (tag === 0x0132) result.dateTime = readAscii(entryOffset);
+            else if (tag === 0x8769) exifIFDOffset = readUInt32(entryOffset + 8);
+        });
+        
+        if (exifIFDOffset !== null) {
+            readIFD(exifIFDOffset, (tag, entryOffset) => {
+                if (tag === 0x9003) result.dateTimeOriginal = readAscii(entryOffset);
+            });
+        }
+    } catch {
+        // 손상된 EXIF는 무시
+    }
+    
+    return result;
+}
+
+// 이미지 메타데이터 추출 (sharp + EXIF)
+async function extractImageMetadata(imagePath) {
+    const info = await sharp(imagePath).metadata();
+    
+    let width = info.width || null;
+    let height = info.height || null;
+    // EXIF 회전(5~8)은 가로/세로가 바뀜
+    if (info.orientation >= 5) {
+        [width, height] = [height, width];
+    }
+    
+    const exif = info.exif ? parseExifBuffer(info.exif) : {};
+    
+    return {
+        width,
+        height,
+        duration: null,
+        codec: info.format || null,
+        camera: formatCameraName(exif.make, exif.model),
+        capturedAt: normalizeCaptureDate(exif.dateTimeOriginal || exif.dateTime)
+    };
+}
+
+// 비디오/오디오 메타데이터 추출 (ffprobe JSON 출력)
+// 파일 경로는 셸을 거치지 않고 인자로 전달 (따옴표, $(), %VAR% 등이 포함된 파일명도 그대로 처리)
+async function extractFFprobeMetadata(command, filePath) {
+    const { stdout } = await execFilePromise(command, [
+        '-v', 'error',
+        '-print_format', 'json',
+        '-show_entries', 'format=duration:format_tags:stream=codec_type,codec_name,width,height:stream_tags=rotate:stream_disposition=attached_pic',
+        '-i', filePath
+    ], { timeout: METADATA_CONFIG.ffprobeTimeoutMs, maxBuffer: 1024 * 1024, windowsHide: true });
+    
+    const probe = JSON.parse(stdout);
+    const streams = probe.streams || [];
+    const format = probe.format || {};
+    const tags = format.tags || {};
+    
+    // 앨범 아트(attached_pic)는 비디오 스트림으로 취급하지 않음
+    const videoStream = streams.find(s => s.codec_type === 'video' && !(s.disposition && s.disposition.attached_pic));
+    const audioStream = streams.find(s => s.codec_type === 'audio');
+    
+    let width = videoStream?.width || null;
+    let height = videoStream?.height || null;
+    const rotate = Math.abs(parseInt(videoStream?.tags?.rotate || '0', 10));
+    if (rotate === 90 || rotate === 270) {
+        [width, height] = [height, width];
+    }
+    
+    const duration = parseFloat(format.duration);
+    
+    return {
+        width,
+        height,
+        duration: isNaN(duration) ? null : Math.round(duration * 1000) / 1000,
+        codec: (videoStream || audioStream)?.codec_name || null,
+        camera: formatCameraName(
+            tags['com.apple.quicktime.make'] || tags.make,
+            tags['com.apple.quicktime.model'] || tags.model
+        ),
+        capturedAt: normalizeCaptureDate(tags['com.apple.quicktime.creationdate'] || tags.creation_time)
+    };
+}
+
+// 캐시 항목에서 API용 메타데이터만 추출
+function toPublicMetadata(entry) {
+    const metadata = {};
+    for (const field of MEDIA_METADATA_FIELDS) {
+        metadata[field] = entry[field] ?? null;
+    }
+    return metadata;
+}
+
+// 스캔된 파일들의 메타데이터를 캐시 우선으로 일괄 추출
+async function extractMediaMetadataBatch(jobs, capabilities) {
+    if (jobs.length === 0) {
+        return;
+    }
+    
+    const startTime = Date.now();
+    const needsFFprobe = jobs.some(job => job.mediaType !== 'image');
+    const probeCommand = needsFFprobe && capabilities.available
+        ? await resolveFFprobeCommand(capabilities)
+        : null;
+    
+    let hits = 0;
+    let extracted = 0;
+    let failed = 0;
+    let deferred = 0;
+    metadataQueueDepth += jobs.length;
+    
+    await runWorkerPool(jobs, METADATA_CONFIG.concurrency, async ({ fileInfo, stats, mediaType }) => {
+        try {
+            const cacheKey = await generateMetadataCacheKey(fileInfo.fullPath, stats, mediaType);
+            const cached = mediaMetadataCache.entries.get(cacheKey);
+            if (cached) {
+                cached.accessTime = Date.now();
+                fileInfo.metadata = toPublicMetadata(cached);
+                incCounter(metrics.metadataCacheRequests, { result: 'hit' });
+                hits++;
+                return;
+            }
+            incCounter(metrics.metadataCacheRequests, { result: 'miss' });
+            
+            if (mediaType !== 'image' && !probeCommand) {
+                // ffprobe가 없으면 실패를 캐시하지 않음 (설치되면 다음 확인 때부터 추출)
+                return;
+            }
+            
+            let metadata;
+            const endMetadataTimer = startTimer(metrics.metadataDuration, {
+                source: mediaType === 'image' ? 'sharp' : 'ffprobe'
+            });
+            try {
+                metadata = mediaType === 'image'
+                    ? await extractImageMetadata(fileInfo.fullPath)
+                    : await extractFFprobeMetadata(probeCommand, fileInfo.fullPath);
+                endMetadataTimer({ result: 'ok' });
+                extracted++;
+            } catch (error) {
+                endMetadataTimer({ result: 'error' });
+                if (isTransientMetadataError(error)) {
+                    deferred++;
+                    log.metadata.debug('Metadata extraction deferred', {
+                        file: fileInfo.filename,
+                        code: error.code,
+                        signal: error.signal,
+                        error: error.message
+                    });
+                    return;
+                }
+                // ffprobe/sharp 가 거부한 파일은 기록해서 변경 전까지 다시 시도하지 않음
+                metadata = toPublicMetadata({});
+                failed++;
+            }
+            
+            mediaMetadataCache.entries.set(cacheKey, {
+                ...metadata,
+                probedAt: Date.now(),
+                accessTime: Date.now()
+            });
+            fileInfo.metadata = metadata;
+        } catch {
+            failed++;
+        } finally {
+            metadataQueueDepth--;
+        }
+    });
+    
+    if (extracted > 0 || failed > 0) {
+        scheduleMediaMetadataSave();
+    }
+    
+    log.metadata.info('Metadata extraction complete', {
+        files: jobs.length,
+        cacheHits: hits,
+        extracted,
+        failed,
+        deferred,
+        durationMs: Date.now() - startTime
+    });
+}
+
+// 파일 자체가 아니라 환경 때문에 실패한 경우 (제한 시간 초과, NAS 끊김, 잠긴 파일 등)
+// 이런 실패는 캐시하지 않고 다음 스캔에서 다시 추출
+const TRANSIENT_METADATA_ERROR_CODES = new Set([
+    'ETIMEDOUT', 'EBUSY', 'EIO', 'EACCES', 'EPERM', 'ENOENT', 'EAGAIN',
+    'ECONNRESET', 'ECONNABORTED', 'ENOTCONN', 'ENETUNREACH', 'EHOSTDOWN', 'EMFILE', 'ENFILE', 'ENOMEM'
+]);
+
+function isTransientMetadataError(error) {
+    // execFile 제한 시간 초과는 프로세스를 종료시킴 (killed/signal)
+    if (error.killed || error.signal) {
+        return true;
+    }
+    return typeof error.code === 'string' && TRANSIENT_METADATA_ERROR_CODES.has(error.code);
+}
+
+// 검색 정렬 기준 (null 값은 항상 마지막)
+const SEARCH_SORT_FIELDS = {
+    filename: file => file.filename.toLowerCase(),
+    size: file => file.size,
+    modifiedAt: file => Date.parse(file.modifiedAt),
+    width: file => file.metadata?.width ?? null,
+    height: file => file.metadata?.height ?? null,
+    resolution: file => file.metadata?.width && file.metadata?.height
+        ? file.metadata.width * file.metadata.height
+        : null,
+    duration: file => file.metadata?.duration ?? null,
+    capturedAt: file => file.metadata?.capturedAt ? Date.parse(file.metadata.capturedAt) : null,
+    camera: file => file.metadata?.camera?.toLowerCase() ?? null,
+    codec: file => file.metadata?.codec ?? null
+};
+
+// 세션별 정렬 인덱스 (스캔 결과가 바뀌기 전까지 재사용)
+function getSortedSessionFiles(session, sortBy, sortOrder = 'desc') {
+    // 상속된 속성 이름(hasOwnProperty 등)은 정렬 필드로 취급하지 않음
+    if (typeof sortBy !== 'string' || !Object.hasOwn(SEARCH_SORT_FIELDS, sortBy)) {
+        return session.files;
+    }
+    const getValue = SEARCH_SORT_FIELDS[sortBy];
+    
+    const order = sortOrder === 'asc' ? 'asc' : 'desc';
+    const indexKey = `${sortBy}:${order}`;
+    if (!session.sortIndexes) {
+        session.sortIndexes = new Map();
+    }
+    
+    let sortedFiles = session.sortIndexes.get(indexKey);
+    if (!sortedFiles) {
+        const direction = order === 'asc' ? 1 : -1;
+        sortedFiles = session.files
+            .map(file => ({ file, value: getValue(file) }))
+            .sort((a, b) => {
+                if (a.value === null) return b.value === null ? 0 : 1;
+                if (b.value === null) return -1;
+                if (a.value < b.value) return -direction;
+                if (a.value > b.value) return direction;
+                return 0;
+            })
+            .map(item => item.file);
+        session.sortIndexes.set(indexKey, sortedFiles);
+    }
+    
+    return sortedFiles;
+}
+
+// 메타데이터 필터 조건 준비 (요청당 한 번만 파싱)
+function buildMetadataFilter(filters) {
+    if (!filters || typeof filters !== 'object') {
+        return null;
+    }
+    
+    const toNumber = value => (value === undefined || value === null || value === '' || isNaN(Number(value)))
+        ? null
+        : Number(value);
+    const toTime = value => {
+        if (value === undefined || value === null || value === '') return null;
+        const time = typeof value === 'number' ? value : Date.parse(value);
+        return isNaN(time) ? null : time;
+    };
+    
+    const conditions = {
+        minWidth: toNumber(filters.minWidth),
+        minHeight: toNumber(filters.minHeight),
+        minDuration: toNumber(filters.minDuration),
+        maxDuration: toNumber(filters.maxDuration),
+        codec: filters.codec ? String(filters.codec).toLowerCase() : null,
+        camera: filters.camera ? String(filters.camera).toLowerCase() : null,
+        capturedAfter: toTime(filters.capturedAfter),
+        capturedBefore: toTime(filters.capturedBefore)
+    };
+    
+    if (Object.values(conditions).every(value => value === null)) {
+        return null;
+    }
+    
+    return (file) => {
+        const metadata = file.metadata;
+        if (!metadata) {
+            return false;
+        }
+        if (conditions.minWidth !== null && !(metadata.width >= conditions.minWidth)) return false;
+        if (conditions.minHeight !== null && !(metadata.height >= conditions.minHeight)) return false;
+        if (conditions.minDuration !== null && !(metadata.duration >= conditions.minDuration)) return false;
+        if (conditions.maxDuration !== null && !(metadata.duration <= conditions.maxDuration)) return false;
+        if (conditions.codec !== null && (metadata.codec || '').toLowerCase() !== conditions.codec) return false;
+        if (conditions.camera !== null && !(metadata.camera || '').toLowerCase().includes(conditions.camera)) return false;
+        if (conditions.capturedAfter !== null || conditions.capturedBefore !== null) {
+            const capturedTime = metadata.capturedAt ? Date.parse(metadata.capturedAt) : null;
+            if (capturedTime === null) return false;
+            if (conditions.capturedAfter !== null && capturedTime < conditions.capturedAfter) return false;
+            if (conditions.capturedBefore !== null && capturedTime > conditions.capturedBefore) return false;
+        }
+        return true;
+    };
+}
+
 // API Routes
 app.post('/api/validate-path', async (req, res) => {
     const { path: folderPath } = req.body;
@@ -1485,6 +2563,15 @@ app.post('/api/validate-path', async (req, res) => {
     res.json(validation);
 });
 
+// 스캔/검색 응답 전송 (압축 협상 + 전송량 메트릭)
+async function sendApiResponse(req, res, route, format, payload, options) {
+    const result = await sendJson(req, res, payload, options);
+    const labels = { route, format, encoding: result.encoding || 'identity' };
+    incCounter(metrics.apiResponseBytes, labels, result.bytes);
+    incCounter(metrics.apiResponseRawBytes, labels, result.rawBytes);
+    (route === 'scan' ? log.scan : log.search).debug('API response sent', { ...labels, bytes: result.bytes, rawBytes: result.rawBytes });
+}
+
 app.post('/api/scan', async (req, res) => {
     const { path: folderPath, sessionId, includeSubfolders = true, maxDepth = 3 } = req.body;
     
@@ -1507,30 +2594,47 @@ app.post('/api/scan', async (req, res) => {
     }
     
     try {
-        console.log(`📂 Scanning: ${folderPath}`);
-        console.log(`  Options: subfolders=${includeSubfolders}, maxDepth=${maxDepth}`);
+        log.scan.info('Scan started', { path: folderPath, includeSubfolders, maxDepth });
         
         const ffmpegCapabilities = await checkFFmpegCapabilities();
         if (!ffmpegCapabilities.available) {
-            console.log('⚠️  FFmpeg not found. Video thumbnails will not be generated.');
-            console.log('💡 To fix this: Run "썸네일 안만들어질 때 눌러주세요.bat" file');
+            log.scan.warn('FFmpeg not found. Video thumbnails will not be generated.', {
+                solution: 'Run "썸네일 안만들어질 때 눌러주세요.bat"'
+            });
         } else {
-            const source = ffmpegCapabilities.source === 'runtime' ? ' (from runtime folder)' : '';
-            console.log(`✅ FFmpeg available with ${ffmpegCapabilities.hwaccel || 'CPU'} acceleration${source}`);
+            log.scan.debug('FFmpeg available', {
+                hwaccel: ffmpegCapabilities.hwaccel || 'cpu',
+                source: ffmpegCapabilities.source
+            });
         }
         
         const startTime = Date.now();
-        const files = await scanDirectory(
-            folderPath, 
-            folderPath, 
-            includeSubfolders ? maxDepth : 1,
-            0
-        );
+        const endScanTimer = startTimer(metrics.scanDuration);
+        const metadataJobs = [];
+        const scanSummary = { counts: {}, durationsMs: {} };
+        const files = await scanSummaryStorage.run(scanSummary, async () => {
+            const scannedFiles = await scanDirectory(
+                folderPath, 
+                folderPath, 
+                includeSubfolders ? maxDepth : 1,
+                0,
+                metadataJobs
+            );
+            await extractMediaMetadataBatch(metadataJobs, ffmpegCapabilities);
+            return scannedFiles;
+        });
+        endScanTimer();
         const scanTime = Date.now() - startTime;
         
         files.sort((a, b) => new Date(b.modifiedAt) - new Date(a.modifiedAt));
         
-        console.log(`✅ Scan complete: ${files.length} files in ${scanTime}ms`);
+        log.scan.info('Scan complete', {
+            path: folderPath,
+            files: files.length,
+            durationMs: scanTime,
+            events: scanSummary.counts,
+            eventDurationsMs: scanSummary.durationsMs
+        });
         
         // 미디어 타입별 카운트 계산
         const mediaCounts = {
@@ -1548,12 +2652,14 @@ app.post('/api/scan', async (req, res) => {
             files: files,
             status: 'completed',
             scanTime: scanTime,
-            mediaCounts: mediaCounts
+            mediaCounts: mediaCounts,
+            sortIndexes: new Map(),
+            version: `${SESSION_BOOT_ID}-${++sessionVersionCounter}`
         };
         
         sessions.set(sessionId, scanResult);
         
-        res.json({
+        await sendApiResponse(req, res, 'scan', 'json', {
             status: 'success',
             message: `Found ${files.length} media files in ${scanTime}ms`,
             totalFiles: files.length,
@@ -1570,7 +2676,7 @@ app.post('/api/scan', async (req, res) => {
             mediaCounts: mediaCounts
         });
     } catch (error) {
-        console.error('Scan error:', error);
+        log.scan.error('Scan error', { path: folderPath, error: error.message, stack: error.stack });
         res.status(500).json({ 
             status: 'error', 
             message: error.message 
@@ -1580,7 +2686,7 @@ app.post('/api/scan', async (req, res) => {
 
 // 미디어 타입 필터 + 북마크 필터 추가된 검색 API
 app.post('/api/search', async (req, res) => {
-    const { query, sessionId, mediaType, bookmarkedOnly, bookmarks } = req.body;
+    const { query, sessionId, mediaType, bookmarkedOnly, bookmarks, sortBy, sortOrder, metadataFilters, format } = req.body;
     
     if (!sessionId) {
         return res.status(400).json({ error: 'SessionId is required' });
@@ -1594,12 +2700,24 @@ app.post('/api/search', async (req, res) => {
     }
     
     // 디버깅용 로그
-    console.log('검색어:', query, '미디어 타입:', mediaType, '북마크만:', bookmarkedOnly);
+    log.search.debug('Search request', { query, mediaType, bookmarkedOnly, sortBy });
     
     // 검색어 처리
     const searchQuery = query?.trim() || '';
     
-    let filteredFiles = session.files;
+    // 같은 세션 데이터 + 같은 조건이면 결과도 같으므로 필터링 전에 ETag 비교
+    const responseFormat = format === 'compact' ? 'compact' : 'json';
+    const etag = createETag([
+        session.version, searchQuery, mediaType || 'all', bookmarkedOnly ? bookmarks || [] : null,
+        sortBy || null, sortOrder || null, metadataFilters || null, responseFormat
+    ]);
+    if (isNotModified(req, etag)) {
+        incCounter(metrics.apiNotModified, { route: 'search' });
+        return sendNotModified(res, etag);
+    }
+    
+    // 정렬 요청 시 세션 정렬 인덱스에서 시작 (필터링 후에도 순서 유지)
+    let filteredFiles = sortBy ? getSortedSessionFiles(session, sortBy, sortOrder) : session.files;
     
     // 북마크 필터링 - fullPath 기준으로 변경
     if (bookmarkedOnly && bookmarks && bookmarks.length > 0) {
@@ -1639,15 +2757,24 @@ app.post('/api/search', async (req, res) => {
         filteredFiles = filteredFiles.filter(file => file.mediaType === mediaType);
     }
     
-    console.log(`검색 결과: ${filteredFiles.length}개 (타입: ${mediaType || 'all'}, 북마크: ${bookmarkedOnly})`);
+    // 메타데이터 필터링 (해상도, 길이, 코덱, 카메라, 촬영일)
+    const metadataFilter = buildMetadataFilter(metadataFilters);
+    if (metadataFilter) {
+        filteredFiles = filteredFiles.filter(metadataFilter);
+    }
     
-    res.json({
+    observeHistogram(metrics.searchResults, {}, filteredFiles.length);
+    log.search.debug('Search results', { results: filteredFiles.length, mediaType: mediaType || 'all', bookmarkedOnly });
+    
+    const pageFiles = filteredFiles.slice(0, 500);
+    await sendApiResponse(req, res, 'search', responseFormat, {
         status: 'success',
         totalResults: filteredFiles.length,
         currentPath: session.currentPath,
-        files: filteredFiles.slice(0, 500),
+        format: responseFormat,
+        files: responseFormat === 'compact' ? encodeCompactFiles(pageFiles, MEDIA_METADATA_FIELDS) : pageFiles,
         mediaCounts: session.mediaCounts
-    });
+    }, { etag });
 });
 
 app.get('/api/recent-paths', (req, res) => {
@@ -1787,7 +2914,16 @@ app.get('/api/cache-status', (req, res) => {
             lastCleanup: new Date(cacheMetadata.lastCleanup).toISOString(),
             hitRate: calculateCacheHitRate(),
             oldestFile: getOldestCacheFile(),
-            newestFile: getNewestCacheFile()
+            newestFile: getNewestCacheFile(),
+            usagePercent: Math.round(cacheMetadata.totalSize / (CACHE_CONFIG.maxSizeGB * 1024 * 1024 * 1024) * 1000) / 10,
+            metadataEntries: mediaMetadataCache.entries.size,
+            sharedCacheDir: SHARED_CACHE_CONFIG.dir
+        },
+        gpu: {
+            lastDetection: gpuPerformanceCache.lastDetection ? new Date(gpuPerformanceCache.lastDetection).toISOString() : null,
+            optimalAccelerator: gpuPerformanceCache.optimalAccelerator || 'none',
+            detectionCount: gpuPerformanceCache.detectionCount,
+            availableAccelerators: Object.keys(gpuPerformanceCache.performanceMetrics).length
         },
         config: CACHE_CONFIG
     });
@@ -1809,9 +2945,16 @@ app.post('/api/cache-cleanup', async (req, res) => {
     }
 });
 
-// 캐시 히트율 계산 (간단한 추정)
+// 캐시 히트율 계산 (히트/미스 카운터 기반, 조회 기록이 없으면 최근 접근 비율로 추정)
 function calculateCacheHitRate() {
-    // 실제 구현에서는 히트/미스 카운터를 사용
+    const hits = ['image', 'video'].reduce((sum, kind) =>
+        sum + getCounterValue(metrics.thumbnailCacheRequests, { kind, result: 'hit' }), 0);
+    const misses = ['image', 'video'].reduce((sum, kind) =>
+        sum + getCounterValue(metrics.thumbnailCacheRequests, { kind, result: 'miss' }), 0);
+    if (hits + misses > 0) {
+        return Math.round(hits / (hits + misses) * 100);
+    }
+    
     const recentAccess = Array.from(cacheMetadata.files.values())
         .filter(meta => Date.now() - meta.accessTime < 24 * 60 * 60 * 1000).length;
     
@@ -1897,27 +3040,18 @@ app.post('/api/reset-gpu-cache', async (req, res) => {
     }
 });
 
-// 향상된 캐시 상태 API
-app.get('/api/cache-status', (req, res) => {
-    const totalSizeMB = (cacheMetadata.totalSize / 1024 / 1024).toFixed(2);
-    const maxSizeMB = (CACHE_CONFIG.maxSizeGB * 1024).toFixed(0);
-    const usage = ((cacheMetadata.totalSize / (CACHE_CONFIG.maxSizeGB * 1024 * 1024 * 1024)) * 100).toFixed(1);
-    
+// Prometheus 스크레이프 엔드포인트
+app.get('/metrics', (req, res) => {
+    res.type('text/plain; version=0.0.4; charset=utf-8');
+    res.send(renderMetrics());
+});
+
+// 최근 요청 트레이스 (x-trace: 1 헤더 또는 MEDIA_EXPLORER_TRACE=1 로 수집)
+app.get('/api/traces', (req, res) => {
     res.json({
         status: 'success',
-        cache: {
-            totalFiles: cacheMetadata.files.size,
-            totalSize: `${totalSizeMB}MB`,
-            maxSize: `${maxSizeMB}MB`,
-            usage: `${usage}%`,
-            lastCleanup: new Date(cacheMetadata.lastCleanup).toISOString()
-        },
-        gpu: {
-            lastDetection: gpuPerformanceCache.lastDetection ? new Date(gpuPerformanceCache.lastDetection).toISOString() : null,
-            optimalAccelerator: gpuPerformanceCache.optimalAccelerator || 'none',
-            detectionCount: gpuPerformanceCache.detectionCount,
-            availableAccelerators: Object.keys(gpuPerformanceCache.performanceMetrics).length
-        }
+        tracingEnabled: METRICS_CONFIG.tracingEnabled,
+        traces: recentTraces.slice().reverse()
     });
 });
 
@@ -1953,6 +3087,7 @@ const server = app.listen(PORT, '127.0.0.1', async () => {
         console.log(`   🧵 CPU Threads: ${capabilities.threads} cores`);
         console.log(`   🔥 AVX-512 Support: ${capabilities.avx512 ? '✅ Enhanced' : '⚠️  Basic'}`);
         console.log(`   💾 Smart Cache: ✅ LRU + ${CACHE_CONFIG.maxSizeGB}GB limit`);
+        console.log(`   🌐 Shared Cache: ${SHARED_CACHE_CONFIG.dir ? '✅ ' + SHARED_CACHE_CONFIG.dir : '❌ Off (set SHARED_CACHE_DIR)'}`);
         console.log(`   📊 Cache Stats: ${cacheMetadata.files.size} files, ${(cacheMetadata.totalSize / 1024 / 1024).toFixed(1)}MB`);
         console.log('================================================');
         console.log('📌 Instructions:');
@@ -1962,7 +3097,7 @@ const server = app.listen(PORT, '127.0.0.1', async () => {
         console.log('   4. Experience 20-100x faster thumbnails! 🚀');
         console.log('================================================');
         console.log('⭐ Features: 한글검색 + 북마크 + HEIC + GPU가속 + 지능형캐시');
-        console.log('🔧 Monitoring: /api/cache-status for cache info');
+        console.log('🔧 Monitoring: /api/cache-status for cache info, /metrics for Prometheus metrics');
         console.log('================================================');
         console.log('Press Ctrl+C to stop the server\n');
     }, 1000);
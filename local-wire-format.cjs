@@ -0,0 +1,235 @@
+/**
+ * Media File Explorer - 응답 와이어 포맷
+ * 검색 결과 컬럼형(compact) 인코딩 + gzip/brotli 협상 + ETag 조건부 응답
+ *
+ * compact 포맷 (files 필드):
+ *   {
+ *     version: 1, count,
+ *     dirs: { prefix: [...], path: [...] },   // 디렉터리 접두사 사전 (fullPath = prefix + filename)
+ *     types: ['image/jpg', ...],              // type 사전 (mediaType/extension)
+ *     filename: [...], dir: [...], type: [...], size: [...],
+ *     modifiedAt: [...],                      // epoch ms
+ *     thumbnail: [...],                       // 썸네일 키 (URL은 mediaType으로 유도), 없으면 null
+ *     metadata: { width: [...], ... } | null  // 값이 있는 필드만, capturedAt 은 epoch ms
+ *   }
+ * 브라우저 디코더: public/static/compact-files.js
+ */
+
+const zlib = require('zlib');
+const util = require('util');
+const crypto = require('crypto');
+
+const gzipAsync = util.promisify(zlib.gzip);
+const brotliCompressAsync = util.promisify(zlib.brotliCompress);
+
+const WIRE_CONFIG = {
+    compressionMinBytes: 1024, // 이보다 작은 응답은 압축하지 않음
+    gzipLevel: 6,
+    brotliQuality: 4 // 기본값(11)은 응답마다 쓰기에는 너무 느림
+};
+
+const COMPACT_FORMAT_VERSION = 1;
+
+// 썸네일 URL 규칙 (local-server.cjs 의 serve-thumbnail 라우트와 동일)
+const THUMBNAIL_ROUTES = {
+    image: '/api/serve-thumbnail/',
+    video: '/api/serve-video-thumbnail/'
+};
+
+// compact 포맷에서 epoch ms 로 보내는 메타데이터 필드
+const METADATA_TIMESTAMP_FIELDS = new Set(['capturedAt']);
+
+// 썸네일 URL -> 키 (규칙에 맞지 않는 URL은 그대로 보냄)
+function toThumbnailKey(thumbnailUrl, mediaType) {
+    if (!thumbnailUrl) {
+        return null;
+    }
+    const route = THUMBNAIL_ROUTES[mediaType];
+    if (route && thumbnailUrl.startsWith(route) && thumbnailUrl.endsWith('.jpg')) {
+        return thumbnailUrl.slice(route.length, -4);
+    }
+    return thumbnailUrl;
+}
+
+function toTimestamp(value) {
+    if (value === null || value === undefined) {
+        return null;
+    }
+    const time = new Date(value).getTime();
+    return isNaN(time) ? null : time;
+}
+
+// 파일 객체 배열 -> 컬럼형 구조
+function encodeCompactFiles(files, metadataFields = []) {
+    const dirIndexes = new Map();
+    const typeIndexes = new Map();
+    const dirs = { prefix: [], path: [] };
+    const types = [];
+    const columns = {
+        filename: new Array(files.length),
+        dir: new Array(files.length),
+        type: new Array(files.length),
+        size: new Array(files.length),
+        modifiedAt: new Array(files.length),
+        thumbnail: new Array(files.length)
+    };
+    const metadataColumns = {};
+    for (const field of metadataFields) {
+        metadataColumns[field] = new Array(files.length).fill(null);
+    }
+    const usedMetadataFields = new Set();
+
+    for (let i = 0; i < files.length; i++) {
+        const file = files[i];
+
+        // fullPath 는 항상 filename 으로 끝나므로 앞부분만 사전에 저장
+        const prefix = file.fullPath.slice(0, file.fullPath.length - file.filename.length);
+        const dirKey = `${prefix}\0${file.path}`;
+        let dirIndex = dirIndexes.get(dirKey);
+        if (dirIndex === undefined) {
+            dirIndex = dirs.prefix.length;
+            dirIndexes.set(dirKey, dirIndex);
+            dirs.prefix.push(prefix);
+            dirs.path.push(file.path);
+        }
+
+        let typeIndex = typeIndexes.get(file.type);
+        if (typeIndex === undefined) {
+            typeIndex = types.length;
+            typeIndexes.set(file.type, typeIndex);
+            types.push(file.type);
+        }
+
+        columns.filename[i] = file.filename;
+        columns.dir[i] = dirIndex;
+        columns.type[i] = typeIndex;
+        columns.size[i] = file.size;
+        columns.modifiedAt[i] = toTimestamp(file.modifiedAt);
+        columns.thumbnail[i] = toThumbnailKey(file.thumbnailUrl, file.mediaType);
+
+        if (file.metadata) {
+            for (const field of metadataFields) {
+                const value = file.metadata[field];
+                if (value === null || value === undefined) {
+                    continue;
+                }
+                metadataColumns[field][i] = METADATA_TIMESTAMP_FIELDS.has(field) ? toTimestamp(value) : value;
+                usedMetadataFields.add(field);
+            }
+        }
+    }
+
+    let metadata = null;
+    if (usedMetadataFields.size > 0) {
+        metadata = {};
+        for (const field of metadataFields) {
+            if (usedMetadataFields.has(field)) {
+                metadata[field] = metadataColumns[field];
+            }
+        }
+    }
+
+    return {
+        version: COMPACT_FORMAT_VERSION,
+        count: files.length,
+        dirs,
+        types,
+        ...columns,
+        metadata
+    };
+}
+
+// 요청 파라미터 + 데이터 버전으로 만든 약한 ETag (본문을 만들기 전에 비교 가능)
+function createETag(parts) {
+    const hash = crypto.createHash('md5').update(JSON.stringify(parts)).digest('hex');
+    return `W/"${hash}"`;
+}
+
+function isNotModified(req, etag) {
+    const header = req.headers['if-none-match'];
+    if (!header || !etag) {
+        return false;
+    }
+    return header.split(',').some(candidate => candidate.trim() === etag || candidate.trim() === '*');
+}
+
+// Accept-Encoding 협상 (q=0 은 거부로 처리, 동률이면 br 우선)
+function negotiateEncoding(acceptEncoding) {
+    if (!acceptEncoding) {
+        return null;
+    }
+
+    const weights = {};
+    for (const part of acceptEncoding.split(',')) {
+        const [name, ...params] = part.trim().toLowerCase().split(';');
+        const qParam = params.map(param => param.trim()).find(param => param.startsWith('q='));
+        weights[name] = qParam ? parseFloat(qParam.slice(2)) || 0 : 1;
+    }
+
+    const weightOf = encoding => weights[encoding] ?? weights['*'] ?? 0;
+    const candidates = ['br', 'gzip'].filter(encoding => weightOf(encoding) > 0);
+    if (candidates.length === 0) {
+        return null;
+    }
+    return candidates.reduce((best, encoding) => weightOf(encoding) > weightOf(best) ? encoding : best);
+}
+
+async function compressBody(body, encoding) {
+    if (encoding === 'br') {
+        return brotliCompressAsync(body, {
+            params: {
+                [zlib.constants.BROTLI_PARAM_QUALITY]: WIRE_CONFIG.brotliQuality,
+                [zlib.constants.BROTLI_PARAM_SIZE_HINT]: body.length
+            }
+        });
+    }
+    return gzipAsync(body, { level: WIRE_CONFIG.gzipLevel });
+}
+
+// 조건부 응답용 헤더 (POST 응답은 클라이언트가 직접 ETag 로 재검증하므로 브라우저 캐시는 사용하지 않음)
+function setValidatorHeaders(res, etag) {
+    res.set('ETag', etag);
+    res.set('Cache-Control', 'no-cache');
+}
+
+function sendNotModified(res, etag) {
+    setValidatorHeaders(res, etag);
+    res.status(304).end();
+}
+
+// JSON 응답 전송 (크기에 따라 gzip/brotli 압축)
+// 반환값: { bytes, rawBytes, encoding }
+async function sendJson(req, res, payload, options = {}) {
+    const { etag = null } = options;
+
+    const body = Buffer.from(JSON.stringify(payload));
+    const encoding = body.length >= WIRE_CONFIG.compressionMinBytes
+        ? negotiateEncoding(req.headers['accept-encoding'])
+        : null;
+    const output = encoding ? await compressBody(body, encoding) : body;
+
+    if (etag) {
+        setValidatorHeaders(res, etag);
+    }
+    res.set('Content-Type', 'application/json; charset=utf-8');
+    res.set('Vary', 'Accept-Encoding');
+    if (encoding) {
+        res.set('Content-Encoding', encoding);
+    }
+    res.set('Content-Length', String(output.length));
+    res.end(output);
+
+    return { bytes: output.length, rawBytes: body.length, encoding };
+}
+
+module.exports = {
+    WIRE_CONFIG,
+    COMPACT_FORMAT_VERSION,
+    THUMBNAIL_ROUTES,
+    encodeCompactFiles,
+    createETag,
+    isNotModified,
+    negotiateEncoding,
+    sendNotModified,
+    sendJson
+};
@@ -7,6 +7,7 @@ class MediaExplorer {
         this.files = [];
         this.isScanning = false;
         this.searchTimeout = null;
+        this.searchCache = new CompactFiles.SearchResponseCache(); // compact 검색 응답 + ETag 재사용
         
         // Backend URL - Node.js server
         // In sandbox environment, use public URL instead of localhost
@@ -279,6 +280,7 @@ class MediaExplorer {
             
             if (response.data.status === 'success') {
                 this.currentPath = path;
+                this.searchCache.clear();
                 const scanTime = response.data.scanTime;
                 this.updateStatus('ready', 
                     `${response.data.totalFiles}개 파일 발견 (${scanTime}ms)`
@@ -322,15 +324,16 @@ class MediaExplorer {
         if (!this.currentPath) return;
         
         try {
-            const response = await axios.post(`${this.API_BASE}/api/search`, {
+            const data = await this.searchCache.post(`${this.API_BASE}/api/search`, {
                 query: query,
-                sessionId: this.sessionId
+                sessionId: this.sessionId,
+                format: 'compact'
             });
             
-            if (response.data.status === 'success') {
-                this.files = response.data.files;
-                this.renderFiles(response.data.files);
-                this.updateResultsInfo(response.data.totalResults, query);
+            if (data.status === 'success') {
+                this.files = data.files;
+                this.renderFiles(data.files);
+                this.updateResultsInfo(data.totalResults, query);
             }
         } catch (error) {
             console.error('Search error:', error);
@@ -0,0 +1,170 @@
+// Media File Explorer - compact 검색 응답 디코더
+// 서버의 컬럼형 응답(local-wire-format.cjs)을 복사 없이 행 뷰로 감싸고,
+// 같은 검색 조건은 ETag 로 재검증해 304 응답이면 이전 결과를 그대로 사용합니다.
+
+(function (root) {
+    const COMPACT_FORMAT_VERSION = 1;
+
+    const THUMBNAIL_ROUTES = {
+        image: '/api/serve-thumbnail/',
+        video: '/api/serve-video-thumbnail/'
+    };
+
+    // 파일 한 개의 뷰: 컬럼 배열을 참조만 하고 필드는 읽을 때 계산
+    class CompactFileRow {
+        constructor(columns, index) {
+            this.columns = columns;
+            this.index = index;
+        }
+
+        get filename() {
+            return this.columns.filename[this.index];
+        }
+
+        get path() {
+            return this.columns.dirs.path[this.columns.dir[this.index]];
+        }
+
+        get fullPath() {
+            return this.columns.dirs.prefix[this.columns.dir[this.index]] + this.columns.filename[this.index];
+        }
+
+        get type() {
+            return this.columns.types[this.columns.type[this.index]];
+        }
+
+        get mediaType() {
+            const type = this.type;
+            return type.slice(0, type.indexOf('/'));
+        }
+
+        get extension() {
+            const type = this.type;
+            return type.slice(type.indexOf('/') + 1);
+        }
+
+        get size() {
+            return this.columns.size[this.index];
+        }
+
+        // epoch ms (new Date(file.modifiedAt) 는 기존 ISO 문자열과 동일하게 동작)
+        get modifiedAt() {
+            return this.columns.modifiedAt[this.index];
+        }
+
+        get thumbnailUrl() {
+            const key = this.columns.thumbnail[this.index];
+            if (!key) {
+                return null;
+            }
+            // 규칙에 맞지 않는 URL은 서버가 그대로 보냄 (썸네일 키에는 '/' 가 없음)
+            const route = THUMBNAIL_ROUTES[this.mediaType];
+            if (!route || key.indexOf('/') !== -1) {
+                return key;
+            }
+            return route + key + '.jpg';
+        }
+
+        get metadata() {
+            const metadataColumns = this.columns.metadata;
+            if (!metadataColumns) {
+                return null;
+            }
+
+            let metadata = null;
+            for (const field in metadataColumns) {
+                const value = metadataColumns[field][this.index];
+                if (value !== null) {
+                    metadata = metadata || {};
+                    metadata[field] = value;
+                }
+            }
+            return metadata;
+        }
+
+        toJSON() {
+            return {
+                filename: this.filename,
+                path: this.path,
+                fullPath: this.fullPath,
+                size: this.size,
+                type: this.type,
+                extension: this.extension,
+                modifiedAt: this.modifiedAt,
+                mediaType: this.mediaType,
+                thumbnailUrl: this.thumbnailUrl,
+                metadata: this.metadata
+            };
+        }
+    }
+
+    // 컬럼형 files -> 행 뷰 배열 (문자열/숫자 컬럼은 복사하지 않음)
+    function decodeFiles(columns) {
+        if (columns.version !== COMPACT_FORMAT_VERSION) {
+            throw new Error(`Unsupported compact format version: ${columns.version}`);
+        }
+
+        const rows = new Array(columns.count);
+        for (let i = 0; i < columns.count; i++) {
+            rows[i] = new CompactFileRow(columns, i);
+        }
+        return rows;
+    }
+
+    function decodeResponse(data) {
+        if (data && data.format === 'compact' && data.files) {
+            data.files = decodeFiles(data.files);
+        }
+        return data;
+    }
+
+    // 검색 요청 캐시 (요청 본문별 ETag + 디코딩된 응답, 최근 사용 순)
+    class SearchResponseCache {
+        constructor(limit = 20) {
+            this.limit = limit;
+            this.entries = new Map();
+        }
+
+        async post(url, body) {
+            const key = url + '\n' + JSON.stringify(body);
+            const cached = this.entries.get(key);
+
+            const response = await axios.post(url, body, {
+                headers: cached ? { 'If-None-Match': cached.etag } : {},
+                validateStatus: status => (status >= 200 && status < 300) || status === 304
+            });
+
+            if (response.status === 304 && cached) {
+                this.remember(key, cached);
+                return cached.data;
+            }
+
+            const data = decodeResponse(response.data);
+            const etag = response.headers.etag;
+            if (etag) {
+                this.remember(key, { etag, data });
+            }
+            return data;
+        }
+
+        remember(key, entry) {
+            this.entries.delete(key);
+            this.entries.set(key, entry);
+            if (this.entries.size > this.limit) {
+                this.entries.delete(this.entries.keys().next().value);
+            }
+        }
+
+        clear() {
+            this.entries.clear();
+        }
+    }
+
+    root.CompactFiles = {
+        COMPACT_FORMAT_VERSION,
+        CompactFileRow,
+        decodeFiles,
+        decodeResponse,
+        SearchResponseCache
+    };
+})(typeof window !== 'undefined' ? window : globalThis);